@@ -1,12 +1,18 @@
 """EgoKit: Policy Engine & Scaffolding for AI coding agents."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "EgoKit Contributors"
 __description__ = "Policy Engine & Scaffolding for AI coding agents"
 
-from .compiler import ArtifactCompiler
-from .models import EgoConfig, PolicyRule, Severity
-from .registry import PolicyRegistry
+if TYPE_CHECKING:
+    from .compiler import ArtifactCompiler
+    from .models import EgoConfig, PolicyRule, Severity
+    from .registry import PolicyRegistry
 
 __all__ = [
     "ArtifactCompiler",
@@ -15,3 +21,30 @@ __all__ = [
     "PolicyRule",
     "Severity",
 ]
+
+# Public names resolved on first access (PEP 562) so that importing the
+# package, e.g. for `ego --help`, does not pull in pydantic, YAML and jsonschema.
+_LAZY_ATTRIBUTES = {
+    "ArtifactCompiler": ".compiler",
+    "EgoConfig": ".models",
+    "PolicyRegistry": ".registry",
+    "PolicyRule": ".models",
+    "Severity": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Lazily import public names from their defining submodule."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported names."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
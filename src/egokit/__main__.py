@@ -0,0 +1,28 @@
+"""Entry point for the `ego` script and `python -m egokit`.
+
+Version requests are answered here without importing Typer, Rich or any
+command module; everything else is dispatched to the Typer application.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from ._version import get_version_string
+
+_VERSION_ARGV = (["--version"], ["version"])
+
+
+def main() -> None:
+    """Run the EgoKit CLI, short-circuiting version requests."""
+    if sys.argv[1:] in _VERSION_ARGV:
+        sys.stdout.write(f"EgoKit version {get_version_string()}\n")
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Version lookup shared by the CLI and its lightweight entry point."""
+
+from __future__ import annotations
+
+import re
+from functools import cache
+from pathlib import Path
+
+# Matches the first `version = "..."` assignment in pyproject.toml
+_PYPROJECT_VERSION_RE = re.compile(rb"""version\s*=\s*["']([^"']+)["']""")
+
+
+@cache
+def get_version_string() -> str:
+    """Get version string from package metadata or pyproject.toml."""
+    # importlib.metadata costs ~10ms to import; only pay it when asked
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("egokit")
+    except PackageNotFoundError:
+        pass
+
+    # Try to read version from pyproject.toml for development installs
+    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+    if pyproject_path.exists():
+        match = _PYPROJECT_VERSION_RE.search(pyproject_path.read_bytes())
+        if match:
+            return f"{match.group(1).decode()} (development)"
+
+    return "unknown"
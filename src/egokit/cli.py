@@ -3,66 +3,52 @@
 from __future__ import annotations
 
 import os
-import re
-import sys
 import time
-from datetime import UTC, datetime, timedelta
+from collections import Counter
+from contextlib import suppress
+from functools import cache, lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-try:
-    from importlib.metadata import version as get_version
-except ImportError:
-    from importlib_metadata import version as get_version
-
-from .compiler import ArtifactCompiler, find_egokit_section
+from ._version import get_version_string as _get_version_string
 from .exceptions import EgoKitError
-from .imprint import (
-    AugmentParser,
-    ClaudeCodeParser,
-    DetectorConfig,
-    ImprintReport,
-    PatternDetector,
-    PolicySuggester,
-    SuggesterConfig,
-)
-from .imprint.models import PatternConfidence
-from .models import CompilationContext, Severity
-from .registry import PolicyRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from rich.console import Console
+
+    from .compiler import ArtifactInjector
+    from .imprint import LogParser, Session
+    from .models import EgoConfig, PolicyCharter
+    from .registry import PolicyRegistry
+
+# Domain modules (compiler, registry, models, imprint) are imported inside the
+# commands that use them so `ego --help` and `ego version` stay cheap.
 
 app = typer.Typer(
     name="ego",
     help="EgoKit: Policy Engine & Scaffolding for AI coding agents",
     add_completion=False,
 )
-console = Console()
-
 
-def _get_version_string() -> str:
-    """Get version string from package metadata or pyproject.toml."""
-    try:
-        return get_version("egokit")
-    except (ImportError, ModuleNotFoundError):
-        pass
 
-    # Try to read version from pyproject.toml for development installs
-    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        content = pyproject_path.read_text()
-        match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-        if match:
-            return f"{match.group(1)} (development)"
+@cache
+def _console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
 
-    return "unknown"
+    return Console()
 
 
 def version_callback(value: bool) -> None:
     """Callback for --version flag."""
     if value:
-        console.print(f"EgoKit version {_get_version_string()}")
+        _console().print(f"EgoKit version {_get_version_string()}")
         raise typer.Exit
 
 
@@ -81,11 +67,12 @@ def main_callback(
 
 @app.command()
 def init(
-    path: Path = typer.Option(
-        Path.cwd(),
+    path: Path | None = typer.Option(
+        None,
         "--path",
         "-p",
         help="Directory to initialize policy registry",
+        show_default="current directory",
     ),
     org_name: str = typer.Option(
         "My Organization",
@@ -94,14 +81,19 @@ def init(
     ),
 ) -> None:
     """Initialize a new policy registry with starter templates."""
+    from importlib.resources import files
+
+    # Resolved here rather than as the option default, which would run getcwd
+    # at import time and go stale if the working directory changes
+    path = path or Path.cwd()
     registry_path = path / ".egokit" / "policy-registry"
 
     if registry_path.exists():
-        console.print(
+        _console().print(
             f"[yellow]Warning:[/yellow] Registry exists at {registry_path}",
         )
         if not typer.confirm("Overwrite existing files?"):
-            console.print("Initialization cancelled")
+            _console().print("Initialization cancelled")
             return
 
     try:
@@ -109,186 +101,44 @@ def init(
         (registry_path / "ego").mkdir(parents=True, exist_ok=True)
         (registry_path / "schemas").mkdir(exist_ok=True)
 
-        # Create JSON schemas for validation
-        charter_schema = """\
-{
-  "$schema": "http://json-schema.org/draft-07/schema#",
-  "title": "EgoKit Policy Charter",
-  "type": "object",
-  "required": ["version", "scopes"],
-  "properties": {
-    "version": {
-      "type": "string",
-      "description": "Semantic version of policy charter"
-    },
-    "scopes": {
-      "type": "object",
-      "description": "Hierarchical policy scopes"
-    },
-    "metadata": {
-      "type": "object"
-    }
-  }
-}
-"""
-        ego_schema = """\
-{
-  "$schema": "http://json-schema.org/draft-07/schema#",
-  "title": "EgoKit Ego Configuration",
-  "type": "object",
-  "required": ["version", "ego"],
-  "properties": {
-    "version": {
-      "type": "string",
-      "description": "Semantic version of ego configuration"
-    },
-    "ego": {
-      "type": "object",
-      "description": "AI agent behavior configuration"
-    }
-  }
-}
-"""
-        (registry_path / "schemas" / "charter.schema.json").write_text(
-            charter_schema, encoding="utf-8",
-        )
-        (registry_path / "schemas" / "ego.schema.json").write_text(
-            ego_schema, encoding="utf-8",
-        )
+        # Copy starter schemas, charter and ego configuration from package data
+        templates = files("egokit") / "_templates"
+        for schema_name in ("charter.schema.json", "ego.schema.json"):
+            (registry_path / "schemas" / schema_name).write_bytes(
+                (templates / "schemas" / schema_name).read_bytes(),
+            )
 
-        # Create starter charter.yaml
-        charter_content = f"""\
-# EgoKit Policy Charter
-# =====================
-# This file defines policies that AI coding agents enforce.
-# Run `ego apply` after changes to regenerate AGENTS.md and slash commands.
-#
-# RULE SCHEMA:
-#   - id: "UNIQUE-ID"              # Required (e.g., SEC-001, QUAL-002)
-#     rule: "What to enforce"      # Required
-#     severity: critical           # critical | warning | info
-#     tags: ["tag1", "tag2"]       # Optional, for filtering
-#     rationale: "Why"             # Optional, explains the rule
-#     example_violation: "bad"     # Optional, shows what NOT to do
-#     example_fix: "good"          # Optional, shows correct approach
-#
-# SEVERITY LEVELS:
-#   critical  -> "Must Follow" (blocks contributions)
-#   warning   -> "Should Follow" (code quality)
-#   info      -> "Recommended" (best practices)
-#
-# SCOPES: global < team < project < user < session (later overrides earlier)
-#
-# DOCUMENTATION: See USER_GUIDE.md for full schema reference.
-
-version: 1.0.0
-scopes:
-  global:
-    security:
-      - id: SEC-001
-        rule: "Never commit credentials or secrets"
-        severity: critical
-        example_violation: "api_key = 'sk-123456789abcdef'"
-        example_fix: "api_key = os.environ['API_KEY']"
-        tags: ["security", "credentials"]
-    code_quality:
-      - id: QUAL-001
-        rule: "Use type hints for all function parameters and return values"
-        severity: warning
-        example_violation: "def process_data(data):"
-        example_fix: "def process_data(data: dict[str, Any]) -> list[str]:"
-        tags: ["python", "typing"]
-    documentation:
-      - id: DOCS-001
-        rule: "Avoid superlatives and marketing language"
-        severity: critical
-        example_violation: "This amazing feature is world-class"
-        example_fix: "This feature provides X functionality"
-        tags: ["documentation", "style"]
-metadata:
-  description: "{org_name} policy charter"
-  maintainer: "{org_name} Engineering Team"
-
-# SESSION PROTOCOL (optional):
-# Uncomment to enable context continuity across AI agent sessions.
-# session:
-#   startup:
-#     read: ["PROGRESS.md"]
-#     run: ["git status", "git log --oneline -5"]
-#   shutdown:
-#     update: ["PROGRESS.md"]
-#     commit: false
-#   progress_file: "PROGRESS.md"
-"""
-
-        (registry_path / "charter.yaml").write_text(charter_content, encoding="utf-8")
-
-        # Create starter ego configuration
-        ego_content = """\
-version: 1.0.0
-ego:
-  role: "Senior Software Engineer"
-  tone:
-    voice: "professional, precise, helpful"
-    verbosity: "balanced"
-    formatting:
-      - "code-with-comments"
-      - "bullet-lists-for-steps"
-      - "examples-when-helpful"
-  defaults:
-    structure: "overview → implementation → validation → documentation"
-    code_style: "Follow established project conventions"
-    documentation: "clear, concise, actionable"
-    testing: "unit tests with meaningful assertions"
-  reviewer_checklist:
-    - "Code follows established patterns and conventions"
-    - "Type hints are comprehensive and accurate"
-    - "Error handling is appropriate and informative"
-    - "Documentation is clear and up-to-date"
-    - "Tests cover critical functionality"
-    - "Security best practices are followed"
-  ask_when_unsure:
-    - "Breaking changes to public APIs"
-    - "Security-sensitive modifications"
-    - "Performance-critical optimizations"
-    - "Database schema changes"
-  modes:
-    implementer:
-      verbosity: "balanced"
-      focus: "clean implementation with good practices"
-    reviewer:
-      verbosity: "detailed"
-      focus: "thorough analysis and constructive feedback"
-    security:
-      verbosity: "detailed"
-      focus: "security implications and threat modeling"
-"""
+        charter_template = (templates / "charter.yaml.tmpl").read_text(encoding="utf-8")
+        (registry_path / "charter.yaml").write_bytes(
+            charter_template.replace("{org_name}", org_name).encode("utf-8"),
+        )
 
         ego_path = registry_path / "ego" / "global.yaml"
-        ego_path.write_text(ego_content, encoding="utf-8")
-
-        console.print(f"[green]✓[/green] Registry initialized at {registry_path}")
-        console.print("Created files:")
-        console.print("  • charter.yaml (starter policies)")
-        console.print("  • ego/global.yaml (AI agent configuration)")
-        console.print("  • schemas/ (validation schemas)")
-        console.print("\nNext steps:")
-        console.print(f"  1. Customize policies in {registry_path}/charter.yaml")
-        console.print(f"  2. Adjust AI behavior in {registry_path}/ego/global.yaml")
-        console.print("  3. Run 'ego apply' to generate artifacts")
+        ego_path.write_bytes((templates / "ego" / "global.yaml").read_bytes())
+
+        _console().print(f"[green]✓[/green] Registry initialized at {registry_path}")
+        _console().print("Created files:")
+        _console().print("  • charter.yaml (starter policies)")
+        _console().print("  • ego/global.yaml (AI agent configuration)")
+        _console().print("  • schemas/ (validation schemas)")
+        _console().print("\nNext steps:")
+        _console().print(f"  1. Customize policies in {registry_path}/charter.yaml")
+        _console().print(f"  2. Adjust AI behavior in {registry_path}/ego/global.yaml")
+        _console().print("  3. Run 'ego apply' to generate artifacts")
 
     except OSError as e:
-        console.print(f"[red]Error:[/red] Failed to create policy registry: {e}")
+        _console().print(f"[red]Error:[/red] Failed to create policy registry: {e}")
         raise typer.Exit(1) from e
 
 
 @app.command()
 def apply(
-    repo: Path = typer.Option(
-        Path.cwd(),
+    repo: Path | None = typer.Option(
+        None,
         "--repo",
         "-r",
         help="Target repository path",
+        show_default="current directory",
         exists=True,
         file_okay=False,
         dir_okay=True,
@@ -326,21 +176,28 @@ def apply(
     - Existing files with markers: Updates only the EgoKit-managed section
     - Existing files without markers: Appends EgoKit section (prompts for confirmation)
     """
+    from .compiler import (
+        AUGMENT_COMMANDS_PREFIX,
+        CLAUDE_COMMANDS_PREFIX,
+        ArtifactCompiler,
+        ArtifactInjector,
+        find_egokit_section,
+    )
+    from .models import CompilationContext
+
+    repo = repo or Path.cwd()
     try:
         if registry_path is None:
             registry_path = Path.cwd() / ".egokit" / "policy-registry"
 
         if not registry_path.exists():
-            console.print(
+            _console().print(
                 f"[red]Error:[/red] Policy registry not found at {registry_path}",
             )
             raise typer.Exit(1)
 
-        registry = PolicyRegistry(registry_path)
-
         # Load and merge configurations
-        charter = registry.load_charter()
-        ego_config = registry.merge_ego_configs(scope)
+        charter, ego_config = _load_registry_cached(registry_path, tuple(scope))
 
         # Create compilation context
         context = CompilationContext(
@@ -356,85 +213,139 @@ def apply(
         needs_confirmation = False
 
         if agents_md_path.exists():
-            existing_content = agents_md_path.read_text(encoding="utf-8")
+            existing_content = _read_text(agents_md_path)
             has_markers = find_egokit_section(existing_content) is not None
 
             if not has_markers and not force:
                 # Existing file without markers - need confirmation
                 needs_confirmation = True
-                console.print(
+                _console().print(
                     "[yellow]Warning:[/yellow] AGENTS.md has no EgoKit markers.",
                 )
-                console.print(
+                _console().print(
                     "The EgoKit policy section will be appended to the file.",
                 )
-                console.print("Your existing content will be preserved.\n")
+                _console().print("Your existing content will be preserved.\n")
 
                 if not dry_run:
                     confirm = typer.confirm("Do you want to continue?")
                     if not confirm:
-                        console.print("[yellow]Aborted.[/yellow]")
+                        _console().print("[yellow]Aborted.[/yellow]")
                         raise typer.Exit(0)
 
         # Compile all artifacts using AGENTS.md-first approach
         compiler = ArtifactCompiler(context)
         artifacts = compiler.compile_all_artifacts(existing_agents_md=existing_content)
 
+        # Bucket slash commands by tool directory once for both reports
+        claude_cmds: list[str] = []
+        augment_cmds: list[str] = []
+        for key in artifacts:
+            if key.startswith(CLAUDE_COMMANDS_PREFIX):
+                claude_cmds.append(key)
+            elif key.startswith(AUGMENT_COMMANDS_PREFIX):
+                augment_cmds.append(key)
+
         if dry_run:
-            console.print("[bold blue]Dry run - generated artifacts:[/bold blue]")
+            _console().print("[bold blue]Dry run - generated artifacts:[/bold blue]")
 
             # Show AGENTS.md status
             if existing_content is None:
-                console.print("\n[bold]AGENTS.md:[/bold] (new file with template)")
+                _console().print("\n[bold]AGENTS.md:[/bold] (new file with template)")
             elif needs_confirmation:
-                console.print("\n[bold]AGENTS.md:[/bold] (appending EgoKit section)")
+                _console().print("\n[bold]AGENTS.md:[/bold] (appending EgoKit section)")
             else:
-                console.print("\n[bold]AGENTS.md:[/bold] (updating EgoKit section)")
+                _console().print("\n[bold]AGENTS.md:[/bold] (updating EgoKit section)")
 
-            console.print(artifacts.get("AGENTS.md", "")[:1000] + "...")
+            _print_preview(artifacts.get("AGENTS.md", ""), 1000)
 
-            # Count commands
-            claude_cmds = [k for k in artifacts if k.startswith(".claude/commands/")]
-            augment_cmds = [k for k in artifacts if k.startswith(".augment/commands/")]
-            console.print("\n[bold]Slash commands:[/bold]")
-            console.print(f"  • .claude/commands/ ({len(claude_cmds)} commands)")
-            console.print(f"  • .augment/commands/ ({len(augment_cmds)} commands)")
+            _console().print("\n[bold]Slash commands:[/bold]")
+            _console().print(f"  • {CLAUDE_COMMANDS_PREFIX} ({len(claude_cmds)} commands)")
+            _console().print(f"  • {AUGMENT_COMMANDS_PREFIX} ({len(augment_cmds)} commands)")
 
             # Show one sample command
             if claude_cmds:
                 sample = claude_cmds[0]
-                console.print(f"\n[bold]Sample: {sample}[/bold]")
-                console.print(artifacts[sample][:300] + "...")
+                _console().print(f"\n[bold]Sample: {sample}[/bold]")
+                _print_preview(artifacts[sample], 300)
             return
 
-        # Write all artifacts
-        for path, content in artifacts.items():
-            full_path = repo / path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding="utf-8")
-
-        # Count artifacts by type
-        claude_cmds = [k for k in artifacts if k.startswith(".claude/commands/")]
-        augment_cmds = [k for k in artifacts if k.startswith(".augment/commands/")]
+        written = ArtifactInjector(repo).inject_artifacts(artifacts)
+        unchanged = len(artifacts) - written
 
-        console.print(f"[green]✓[/green] Artifacts synced to {repo}")
+        _console().print(
+            f"[green]✓[/green] Artifacts synced to {repo} "
+            f"({written} written, {unchanged} unchanged)",
+        )
 
         # Show AGENTS.md status
         if existing_content is None:
-            console.print("  • AGENTS.md (created with template)")
+            _console().print("  • AGENTS.md (created with template)")
         elif needs_confirmation:
-            console.print("  • AGENTS.md (appended EgoKit section)")
+            _console().print("  • AGENTS.md (appended EgoKit section)")
         else:
-            console.print("  • AGENTS.md (updated EgoKit section)")
+            _console().print("  • AGENTS.md (updated EgoKit section)")
 
-        console.print(f"  • .claude/commands/ ({len(claude_cmds)} commands)")
-        console.print(f"  • .augment/commands/ ({len(augment_cmds)} commands)")
+        _console().print(f"  • {CLAUDE_COMMANDS_PREFIX} ({len(claude_cmds)} commands)")
+        _console().print(f"  • {AUGMENT_COMMANDS_PREFIX} ({len(augment_cmds)} commands)")
 
     except EgoKitError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _console().print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from e
 
 
+# YAML files in the registry root that are not scope definitions
+_NON_SCOPE_FILES = frozenset({"charter.yaml"})
+
+
+def _list_root_scope_files(registry_path: Path) -> list[str]:
+    """Return scope names for *.yaml files in the registry root.
+
+    Args:
+        registry_path: Path to the policy registry
+
+    Returns:
+        File stems of root-level YAML files other than charter.yaml
+    """
+    try:
+        with os.scandir(registry_path) as entries:
+            return [
+                entry.name.removesuffix(".yaml")
+                for entry in entries
+                if entry.name.endswith(".yaml")
+                and entry.name not in _NON_SCOPE_FILES
+                and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file with universal newlines, like Path.read_text.
+
+    Decoding the raw bytes in one call skips the TextIOWrapper layer; line
+    endings are normalized afterwards only when the file contains a CR.
+    """
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _print_preview(content: str, limit: int) -> None:
+    """Print the head of an artifact verbatim, marking truncation with '...'.
+
+    Markup and highlighting are disabled: artifacts are Markdown whose
+    square brackets would otherwise be parsed as Rich tags.
+    """
+    _console().print(
+        content[:limit],
+        markup=False,
+        highlight=False,
+        end="...\n" if len(content) > limit else "\n",
+    )
+
+
 @app.command()
 def doctor(
     registry_path: Path | None = typer.Option(
@@ -450,42 +361,46 @@ def doctor(
     ),
 ) -> None:
     """Show effective policy configuration and scope resolution."""
+    from rich.table import Table
+
+    from .models import Severity
+    from .registry import PolicyRegistry
+
     try:
         if registry_path is None:
             registry_path = Path.cwd() / ".egokit" / "policy-registry"
 
         registry = PolicyRegistry(registry_path)
+        charter: PolicyCharter | None = None
 
         # Auto-detect scopes if none provided
         if scope is None:
-            scope = []
+            # Insertion-ordered dict doubles as an ordered set of scope names
+            detected: dict[str, None] = {}
 
             # First, try to detect scopes from charter.yaml
             try:
                 charter = registry.load_charter()
                 # Get all scope names defined in the charter
-                charter_scopes = list(charter.scopes.keys())
-                scope.extend(charter_scopes)
+                detected.update(dict.fromkeys(charter.scopes))
             except EgoKitError:
                 # If charter loading fails, fall back to file detection
                 pass
 
             # Also check for separate scope files in registry root
-            for scope_file in registry_path.glob("*.yaml"):
-                if scope_file.name != "charter.yaml":
-                    scope_name = scope_file.stem
-                    if scope_name not in scope:  # Avoid duplicates
-                        scope.append(scope_name)
+            detected.update(dict.fromkeys(_list_root_scope_files(registry_path)))
 
             # Always include global scope if it exists as separate file
             ego_global_path = registry_path / "ego" / "global.yaml"
-            if ego_global_path.exists() and "global" not in scope:
-                scope.append("global")
+            if ego_global_path.exists():
+                detected.setdefault("global")
 
             # Default to global only if no scopes found
-            if not scope:
-                scope = ["global"]
-        else:
+            scope = list(detected) or ["global"]
+
+        if charter is None:
+            # Also reached when auto-detection could not load the charter,
+            # so the load error is reported instead of being swallowed
             charter = registry.load_charter()
         ego_config = registry.merge_ego_configs(scope)
         merged_rules = registry.merge_scope_rules(charter, scope)
@@ -498,118 +413,402 @@ def doctor(
         table.add_row("Policy Version", charter.version)
         table.add_row("Active Scopes", " → ".join(scope))
         table.add_row("Total Rules", str(len(merged_rules)))
-        critical = [r for r in merged_rules if r.severity == Severity.CRITICAL]
-        warning = [r for r in merged_rules if r.severity == Severity.WARNING]
-        table.add_row("Critical Rules", str(len(critical)))
-        table.add_row("Warning Rules", str(len(warning)))
+        severity_counts = Counter(r.severity for r in merged_rules)
+        table.add_row("Critical Rules", str(severity_counts[Severity.CRITICAL]))
+        table.add_row("Warning Rules", str(severity_counts[Severity.WARNING]))
         table.add_row("Ego Role", ego_config.role)
         table.add_row("Ego Voice", ego_config.tone.voice)
         table.add_row("Ego Verbosity", ego_config.tone.verbosity)
 
-        console.print(table)
+        _console().print(table)
 
         # Show rule details
-        console.print("\n[bold]Active Rules:[/bold]")
-        for rule in sorted(merged_rules, key=lambda r: (r.severity.value, r.id)):
+        lines = ["\n[bold]Active Rules:[/bold]"]
+        for rule in sorted(merged_rules, key=attrgetter("severity.value", "id")):
             sev_color = "red" if rule.severity == Severity.CRITICAL else "yellow"
             sev_label = rule.severity.value.upper()
-            console.print(
+            lines.append(
                 f"  [{sev_color}]{sev_label}[/{sev_color}] {rule.id}: {rule.rule}",
             )
+        _console().print("\n".join(lines))
 
     except EgoKitError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _console().print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from e
 
 
 @app.command()
 def watch(
     registry: Path | None = typer.Option(None, help="Path to policy registry"),
-    interval: int = typer.Option(30, help="Check interval in seconds"),
+    interval: int = typer.Option(
+        30, help="Check interval in seconds when polling (watchdog not installed)",
+    ),
 ) -> None:
     """Watch for policy changes and auto-sync AGENTS.md and slash commands."""
+    from .compiler import ArtifactInjector
+
     try:
         registry_path = registry or _discover_registry()
         if not registry_path:
-            console.print("[red]✗[/red] No policy registry found")
+            _console().print("[red]✗[/red] No policy registry found")
             raise typer.Exit(1)
 
-        egokit_projects: list[Path] = []
+        egokit_projects = _discover_projects(Path.cwd())
 
-        # Discover projects with AGENTS.md or AI tool directories
-        for root, dirs, files in os.walk(Path.cwd()):
-            if "AGENTS.md" in files or ".claude" in dirs or ".augment" in dirs:
-                egokit_projects.append(Path(root))
-
-        console.print(f"[blue]Monitoring[/blue] {len(egokit_projects)} projects")
-        console.print(f"[blue]Registry:[/blue] {registry_path}")
+        _console().print(f"[blue]Monitoring[/blue] {len(egokit_projects)} projects")
+        _console().print(f"[blue]Registry:[/blue] {registry_path}")
 
         if not egokit_projects:
-            console.print(
+            _console().print(
                 "[yellow]Warning:[/yellow] No projects with AGENTS.md found",
             )
 
-        last_mtime = registry_path.stat().st_mtime if registry_path.exists() else 0
+        # Injectors only depend on the project path, so build them once
+        injectors = {project: ArtifactInjector(project) for project in egokit_projects}
+
+        if not _watch_with_events(injectors, registry_path):
+            _watch_with_polling(injectors, registry_path, interval)
+
+    except EgoKitError as e:
+        _console().print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+# Quiet period after the last registry event before syncing, so an editor
+# saving several files (or writing via a temp file) triggers a single sync
+_WATCH_DEBOUNCE_SECONDS = 0.5
+
+
+def _watch_with_events(
+    injectors: Mapping[Path, ArtifactInjector], registry_path: Path,
+) -> bool:
+    """Sync projects on filesystem events until interrupted.
+
+    Args:
+        injectors: Artifact injector for each watched project
+        registry_path: Path to the policy registry
+
+    Returns:
+        False if watchdog is not installed, True once watching has stopped
+    """
+    import queue
 
-        while True:
+    try:
+        from watchdog.events import (
+            EVENT_TYPE_CREATED,
+            EVENT_TYPE_DELETED,
+            EVENT_TYPE_MODIFIED,
+            EVENT_TYPE_MOVED,
+            FileSystemEvent,
+            FileSystemEventHandler,
+        )
+        from watchdog.observers import Observer
+    except ImportError:
+        return False
+    if not registry_path.is_dir():
+        return False
+
+    # The handler runs on the observer thread; syncs run here, one at a time
+    changes: queue.SimpleQueue[None] = queue.SimpleQueue()
+
+    class RegistryChangeHandler(FileSystemEventHandler):
+        """Queue a notification for each content change to a registry file."""
+
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            # Opened/closed events fire when the sync itself reads the
+            # registry, so only content changes may trigger it
+            if event.event_type not in {
+                EVENT_TYPE_CREATED,
+                EVENT_TYPE_DELETED,
+                EVENT_TYPE_MODIFIED,
+                EVENT_TYPE_MOVED,
+            }:
+                return
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(_is_registry_input(os.fsdecode(path)) for path in paths):
+                changes.put(None)
+
+    last_loaded = _load_watched_registry(registry_path)
+    observer = Observer()
+    observer.schedule(RegistryChangeHandler(), str(registry_path), recursive=True)
+    observer.start()
+    try:
+        while observer.is_alive():
             try:
-                if not registry_path.exists():
-                    time.sleep(interval)
-                    continue
+                changes.get(timeout=1)
+            except queue.Empty:
+                continue
+            # Let a burst of events (e.g. an editor's write-and-rename) settle
+            with suppress(queue.Empty):
+                while True:
+                    changes.get(timeout=_WATCH_DEBOUNCE_SECONDS)
+            last_loaded = _sync_if_changed(injectors, registry_path, last_loaded)
+    except KeyboardInterrupt:
+        _console().print("\n[yellow]Stopped watching[/yellow]")
+    finally:
+        observer.stop()
+        observer.join()
+    return True
+
 
-                current_mtime = registry_path.stat().st_mtime
+# File types the registry loads; editor swap and backup files are ignored
+_REGISTRY_INPUT_SUFFIXES = (".yaml", ".json")
 
-                if current_mtime > last_mtime:
-                    console.print(
-                        "[green]Policy changes detected,[/green] syncing projects...",
-                    )
-                    _sync_projects(egokit_projects, registry_path)
-                    last_mtime = current_mtime
 
-                time.sleep(interval)
+def _is_registry_input(path: str) -> bool:
+    """Return whether a changed path could affect the compiled artifacts."""
+    return path.endswith(_REGISTRY_INPUT_SUFFIXES)
 
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Stopped watching[/yellow]")
-                break
 
+def _watch_with_polling(
+    injectors: Mapping[Path, ArtifactInjector], registry_path: Path, interval: int,
+) -> None:
+    """Sync projects whenever the registry stamp changes, checking every interval.
+
+    Args:
+        injectors: Artifact injector for each watched project
+        registry_path: Path to the policy registry
+        interval: Seconds to sleep between checks
+    """
+    last_stamp = _registry_stamp(registry_path)
+    last_loaded = _load_watched_registry(registry_path)
+
+    while True:
+        try:
+            time.sleep(interval)
+            current_stamp = _registry_stamp(registry_path)
+            if current_stamp is not None and current_stamp != last_stamp:
+                last_loaded = _sync_if_changed(injectors, registry_path, last_loaded)
+                last_stamp = current_stamp
+
+        except KeyboardInterrupt:
+            _console().print("\n[yellow]Stopped watching[/yellow]")
+            break
+
+
+def _sync_if_changed(
+    injectors: Mapping[Path, ArtifactInjector],
+    registry_path: Path,
+    last_loaded: tuple[PolicyCharter, EgoConfig] | None,
+) -> tuple[PolicyCharter, EgoConfig] | None:
+    """Sync projects unless the loaded registry matches the last sync.
+
+    Timestamps and filesystem events also fire for saves that change nothing
+    (touch, save without edits, checking out identical content); comparing
+    the loaded charter and ego config skips recompiling and re-reading every
+    project then. The registry is read once per check, and the same load
+    feeds the sync.
+
+    Args:
+        injectors: Artifact injector for each watched project
+        registry_path: Path to the policy registry
+        last_loaded: Charter and ego config as of the previous sync
+
+    Returns:
+        Charter and ego config to compare against on the next change, or
+        None if the registry failed to load
+    """
+    try:
+        loaded = _load_registry_cached(registry_path, ("global",))
     except EgoKitError as e:
-        console.print(f"[red]✗[/red] {e}")
-        raise typer.Exit(1) from e
+        _console().print("[green]Policy changes detected,[/green] syncing projects...")
+        for project_path in injectors:
+            _console().print(f"  [red]Failed[/red] {project_path}: {e}")
+        return None
+    if loaded == last_loaded:
+        return last_loaded
+
+    _console().print("[green]Policy changes detected,[/green] syncing projects...")
+    _sync_projects(injectors, *loaded)
+    return loaded
 
 
-def _sync_projects(projects: list[Path], registry_path: Path) -> None:
-    """Sync all projects with the policy registry."""
-    for project_path in projects:
+def _load_watched_registry(registry_path: Path) -> tuple[PolicyCharter, EgoConfig] | None:
+    """Load the global-scope registry that watch syncs, or None if it fails to load."""
+    try:
+        return _load_registry_cached(registry_path, ("global",))
+    except EgoKitError:
+        return None
+
+
+def _registry_stamp(registry_path: Path) -> int | None:
+    """Return the newest modification time across the registry tree.
+
+    The directory's own mtime only changes when entries are added or removed,
+    so in-place edits to charter.yaml or ego/*.yaml are picked up by also
+    stating every file below it.
+
+    Args:
+        registry_path: Path to the policy registry
+
+    Returns:
+        Newest mtime in nanoseconds, or None if the registry does not exist
+    """
+    try:
+        newest = registry_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    pending = [os.fspath(registry_path)]
+    while pending:
         try:
-            policy_registry = PolicyRegistry(registry_path)
-            charter = policy_registry.load_charter()
-            ego_config = policy_registry.merge_ego_configs(["global"])
-
-            context = CompilationContext(
-                target_repo=project_path,
-                policy_charter=charter,
-                ego_config=ego_config,
-                generation_timestamp=datetime.now(tz=UTC),
-            )
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                except OSError:
+                    continue
+    return newest
+
+
+# Directories that never contain EgoKit projects and are expensive to walk
+_PROJECT_SCAN_SKIP_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    ".tox",
+    ".nox",
+    ".venv",
+    "venv",
+    "node_modules",
+    "__pycache__",
+    "build",
+    "dist",
+    "target",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+})
+_AGENT_TOOL_DIRS = frozenset({".claude", ".augment"})
+
+
+def _discover_projects(root: Path) -> list[Path]:
+    """Find directories containing AGENTS.md or AI tool directories.
+
+    Walks the tree breadth-first with os.scandir, skipping VCS, virtualenv,
+    cache and build-output directories as well as the tool directories
+    themselves.
+
+    Args:
+        root: Directory to start the search from
+
+    Returns:
+        Project directories in breadth-first order
+    """
+    projects: list[Path] = []
+    pending = [os.fspath(root)]
+    while pending:
+        next_level: list[str] = []
+        for directory in pending:
+            is_project = False
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name in _AGENT_TOOL_DIRS:
+                            is_project = is_project or entry.is_dir()
+                        elif entry.is_dir(follow_symlinks=False):
+                            if name not in _PROJECT_SCAN_SKIP_DIRS:
+                                next_level.append(entry.path)
+                        elif name == "AGENTS.md":
+                            is_project = True
+            except OSError:
+                continue
+            if is_project:
+                projects.append(Path(directory))
+        pending = next_level
+    return projects
+
+
+# Upper bound on concurrent project writes during `ego watch` syncs
+_SYNC_MAX_WORKERS = 8
+
+
+def _sync_projects(
+    injectors: Mapping[Path, ArtifactInjector],
+    charter: PolicyCharter,
+    ego_config: EgoConfig,
+) -> None:
+    """Sync all projects with the policy registry.
+
+    Artifacts are compiled and encoded once (their content does not depend
+    on the target repository) and written to the projects from a thread
+    pool, so worker threads spend their time in GIL-free write syscalls.
+    Each worker splices the shared EgoKit section into its project's
+    existing AGENTS.md, preserving the human-managed content around it.
+
+    Args:
+        injectors: Artifact injector for each project, keyed by project path
+        charter: Policy charter loaded from the registry
+        ego_config: Merged global ego config loaded from the registry
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import UTC, datetime
+
+    from .compiler import ArtifactCompiler, splice_egokit_section
+    from .models import CompilationContext
 
-            compiler = ArtifactCompiler(context)
-            artifacts = compiler.compile_all_artifacts()
+    if not injectors:
+        return
 
-            # Write all artifacts
-            for path, content in artifacts.items():
-                full_path = project_path / path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                full_path.write_text(content)
+    try:
+        context = CompilationContext(
+            target_repo=next(iter(injectors)),
+            policy_charter=charter,
+            ego_config=ego_config,
+            generation_timestamp=datetime.now(tz=UTC),
+        )
+        compiler = ArtifactCompiler(context)
+        # AGENTS.md here is the full template, used for projects without one
+        artifacts = {
+            path: content.encode("utf-8")
+            for path, content in compiler.compile_all_artifacts().items()
+        }
+        egokit_section = compiler.compile_egokit_section()
+    except EgoKitError as e:
+        for project_path in injectors:
+            _console().print(f"  [red]Failed[/red] {project_path}: {e}")
+        return
 
-            console.print(f"  [green]Synced[/green] {project_path}")
-        except EgoKitError as e:
-            console.print(f"  [red]Failed[/red] {project_path}: {e}")
+    def write_project(injector: ArtifactInjector) -> int | OSError | ValueError:
+        try:
+            existing = _read_text(injector.target_repo / "AGENTS.md")
+        except FileNotFoundError:
+            project_artifacts = artifacts
+        except (OSError, ValueError) as e:
+            return e
+        else:
+            agents_md = splice_egokit_section(existing, egokit_section)
+            project_artifacts = {**artifacts, "AGENTS.md": agents_md.encode("utf-8")}
+
+        try:
+            return injector.inject_artifacts(project_artifacts)
+        except OSError as e:
+            return e
+
+    workers = min(_SYNC_MAX_WORKERS, len(injectors))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(write_project, injectors.values())
+        for project_path, result in zip(injectors, results, strict=True):
+            if isinstance(result, Exception):
+                _console().print(f"  [red]Failed[/red] {project_path}: {result}")
+            elif result:
+                _console().print(
+                    f"  [green]Synced[/green] {project_path} ({result} files updated)",
+                )
+            else:
+                _console().print(f"  [dim]Unchanged[/dim] {project_path}")
 
 
 @app.command()
 def version() -> None:
     """Show EgoKit version information."""
-    console.print(f"EgoKit version {_get_version_string()}")
+    _console().print(f"EgoKit version {_get_version_string()}")
 
 
 @app.command()
@@ -660,6 +859,19 @@ def imprint(
         ego imprint --suggest --explain
         ego imprint --claude-logs ~/.claude/projects/myproject/
     """
+    from datetime import UTC, datetime, timedelta
+
+    from .imprint import (
+        AugmentParser,
+        ClaudeCodeParser,
+        DetectorConfig,
+        ImprintReport,
+        PatternDetector,
+        PolicySuggester,
+        SuggesterConfig,
+    )
+    from .imprint.models import PatternConfidence
+
     # Determine log paths
     if claude_logs is None:
         claude_logs = Path.home() / ".claude" / "projects"
@@ -672,45 +884,37 @@ def imprint(
     }
     min_conf = confidence_map.get(min_confidence.lower(), PatternConfidence.LOW)
 
-    console.print("[bold blue]📊 Imprint Analysis[/bold blue]")
-    console.print(f"   Analyzing sessions from the last {since} days\n")
+    _console().print("[bold blue]📊 Imprint Analysis[/bold blue]")
+    _console().print(f"   Analyzing sessions from the last {since} days\n")
 
     # Parse sessions
-    sessions = []
-    claude_count = 0
-    augment_count = 0
+    cutoff = datetime.now(tz=UTC) - timedelta(days=since)
+    claude_sessions: list[Session] = []
+    augment_sessions: list[Session] = []
 
     # Parse Claude Code logs
     if claude_logs and claude_logs.exists():
-        console.print(f"[dim]Scanning Claude Code logs: {claude_logs}[/dim]")
-        claude_parser = ClaudeCodeParser()
-        cutoff = datetime.now(tz=UTC) - timedelta(days=since)
-        for log_file in claude_parser.discover(claude_logs):
-            for session in claude_parser.parse(log_file):
-                if session.start_time and session.start_time >= cutoff:
-                    sessions.append(session)
-                    claude_count += 1
+        _console().print(f"[dim]Scanning Claude Code logs: {claude_logs}[/dim]")
+        claude_sessions = _collect_recent_sessions(ClaudeCodeParser(), claude_logs, cutoff)
 
     # Parse Augment logs
     if augment_logs and augment_logs.exists():
-        console.print(f"[dim]Scanning Augment logs: {augment_logs}[/dim]")
-        augment_parser = AugmentParser()
-        cutoff = datetime.now(tz=UTC) - timedelta(days=since)
-        for log_file in augment_parser.discover(augment_logs):
-            for session in augment_parser.parse(log_file):
-                if session.start_time and session.start_time >= cutoff:
-                    sessions.append(session)
-                    augment_count += 1
+        _console().print(f"[dim]Scanning Augment logs: {augment_logs}[/dim]")
+        augment_sessions = _collect_recent_sessions(AugmentParser(), augment_logs, cutoff)
+
+    sessions = claude_sessions + augment_sessions
+    claude_count = len(claude_sessions)
+    augment_count = len(augment_sessions)
 
     if not sessions:
-        console.print("[yellow]No sessions found in the specified time range.[/yellow]")
-        console.print("\nTips:")
-        console.print("  • Check that log paths are correct")
-        console.print("  • Try increasing --since value")
-        console.print("  • Ensure you have AI session history")
+        _console().print("[yellow]No sessions found in the specified time range.[/yellow]")
+        _console().print("\nTips:")
+        _console().print("  • Check that log paths are correct")
+        _console().print("  • Try increasing --since value")
+        _console().print("  • Ensure you have AI session history")
         raise typer.Exit(0)
 
-    console.print(f"   Found {len(sessions)} sessions ({claude_count} Claude, {augment_count} Augment)\n")
+    _console().print(f"   Found {len(sessions)} sessions ({claude_count} Claude, {augment_count} Augment)\n")
 
     # Detect patterns
     detector_config = DetectorConfig()
@@ -734,57 +938,49 @@ def imprint(
 
     # Display results
     if not report.has_patterns:
-        console.print("[green]No significant patterns detected.[/green]")
-        console.print("This could mean:")
-        console.print("  • Your AI assistant is already well-tuned")
-        console.print("  • Not enough correction data in the time range")
-        console.print("  • Try increasing --since to analyze more history")
+        _console().print("[green]No significant patterns detected.[/green]")
+        _console().print("This could mean:")
+        _console().print("  • Your AI assistant is already well-tuned")
+        _console().print("  • Not enough correction data in the time range")
+        _console().print("  • Try increasing --since to analyze more history")
         raise typer.Exit(0)
 
-    # Show correction patterns
+    # Render all pattern sections into one buffer so Rich parses and writes
+    # the report once instead of once per line
+    lines: list[str] = []
+
     if corrections:
-        console.print("[bold]Correction Patterns:[/bold]")
+        lines.append("[bold]Correction Patterns:[/bold]")
         for pattern in corrections:
-            conf_color = {"high": "green", "medium": "yellow", "low": "dim"}.get(
-                pattern.confidence.value, "dim",
-            )
-            console.print(
-                f"  [{conf_color}]{pattern.confidence.value.upper()}[/{conf_color}] "
+            lines.append(
+                f"  {_confidence_label(pattern.confidence.value)} "
                 f"{pattern.category}: {pattern.occurrences} occurrences",
             )
-            if explain and pattern.evidence:
-                for ev in pattern.evidence[:2]:
-                    console.print(f'       [dim]→ "{ev[:80]}..."[/dim]')
-        console.print()
+            if explain:
+                lines.extend(_evidence_lines(pattern.evidence))
+        lines.append("")
 
-    # Show style preferences
     if style_prefs:
-        console.print("[bold]Style Preferences:[/bold]")
+        lines.append("[bold]Style Preferences:[/bold]")
         for pref in style_prefs:
-            conf_color = {"high": "green", "medium": "yellow", "low": "dim"}.get(
-                pref.confidence.value, "dim",
-            )
-            console.print(
-                f"  [{conf_color}]{pref.confidence.value.upper()}[/{conf_color}] "
+            lines.append(
+                f"  {_confidence_label(pref.confidence.value)} "
                 f"{pref.preference}: {pref.occurrences} mentions",
             )
-            if explain and pref.evidence:
-                for ev in pref.evidence[:2]:
-                    console.print(f'       [dim]→ "{ev[:80]}..."[/dim]')
-        console.print()
+            if explain:
+                lines.extend(_evidence_lines(pref.evidence))
+        lines.append("")
 
-    # Show implicit patterns
     if implicit:
-        console.print("[bold]Implicit Patterns:[/bold]")
-        for impl_pattern in implicit:
-            conf_color = {"high": "green", "medium": "yellow", "low": "dim"}.get(
-                impl_pattern.confidence.value, "dim",
-            )
-            console.print(
-                f"  [{conf_color}]{impl_pattern.confidence.value.upper()}[/{conf_color}] "
-                f"{impl_pattern.description}",
-            )
-        console.print()
+        lines.append("[bold]Implicit Patterns:[/bold]")
+        lines.extend(
+            f"  {_confidence_label(impl_pattern.confidence.value)} {impl_pattern.description}"
+            for impl_pattern in implicit
+        )
+        lines.append("")
+
+    if lines:
+        _console().print("\n".join(lines))
 
     # Generate suggestions if requested
     if suggest and not dry_run:
@@ -793,24 +989,113 @@ def imprint(
         suggestions = suggester.generate_suggestions(corrections, style_prefs, implicit)
 
         if suggestions:
-            console.print("[bold]Policy Suggestions:[/bold]")
-            console.print("[dim]Add these to your charter.yaml:[/dim]\n")
+            _console().print("[bold]Policy Suggestions:[/bold]")
+            _console().print("[dim]Add these to your charter.yaml:[/dim]\n")
             yaml_output = suggester.to_yaml_snippets(suggestions)
-            console.print(yaml_output)
-            console.print()
+            _console().print(yaml_output)
+            _console().print()
 
             report.policy_suggestions = suggestions
         else:
-            console.print("[dim]No policy suggestions generated at this confidence level.[/dim]")
+            _console().print("[dim]No policy suggestions generated at this confidence level.[/dim]")
 
     # Summary
-    console.print("[bold]Summary:[/bold]")
-    console.print(f"  Sessions analyzed: {report.sessions_analyzed}")
-    console.print(f"  Correction patterns: {len(corrections)}")
-    console.print(f"  Style preferences: {len(style_prefs)}")
-    console.print(f"  Implicit patterns: {len(implicit)}")
+    _console().print("[bold]Summary:[/bold]")
+    _console().print(f"  Sessions analyzed: {report.sessions_analyzed}")
+    _console().print(f"  Correction patterns: {len(corrections)}")
+    _console().print(f"  Style preferences: {len(style_prefs)}")
+    _console().print(f"  Implicit patterns: {len(implicit)}")
     if suggest and report.policy_suggestions:
-        console.print(f"  Policy suggestions: {len(report.policy_suggestions)}")
+        _console().print(f"  Policy suggestions: {len(report.policy_suggestions)}")
+
+
+# Margin for clock skew and naive log timestamps when pruning logs by mtime
+_LOG_MTIME_SLACK_SECONDS = 24 * 60 * 60
+
+
+def _collect_recent_sessions(
+    parser: LogParser,
+    root: Path,
+    cutoff: datetime,
+) -> list[Session]:
+    """Parse the sessions under root that started at or after cutoff.
+
+    A log cannot contain a session that started after the file was last
+    written, so files last modified (with a day of slack) before the cutoff
+    are skipped without being opened.
+
+    Args:
+        parser: Parser for the log format
+        root: Directory to discover log files in
+        cutoff: Earliest session start time to keep
+
+    Returns:
+        Recent sessions in discovery order
+    """
+    oldest_mtime = cutoff.timestamp() - _LOG_MTIME_SLACK_SECONDS
+    sessions: list[Session] = []
+    for log_file in parser.discover(root):
+        try:
+            if log_file.stat().st_mtime < oldest_mtime:
+                continue
+        except OSError:
+            continue
+        sessions.extend(
+            session
+            for session in parser.parse(log_file)
+            if session.start_time and session.start_time >= cutoff
+        )
+    return sessions
+
+
+def _load_registry_cached(
+    registry_path: Path,
+    scope: tuple[str, ...],
+) -> tuple[PolicyCharter, EgoConfig]:
+    """Load the policy charter and merged ego config, reusing unchanged parses.
+
+    Loads go through one long-lived PolicyRegistry per registry path. Its
+    cache is keyed by file contents, so each input is read once per load and
+    re-parsed only when its bytes change, even if an edit keeps the file's
+    size and modification time.
+
+    Args:
+        registry_path: Path to the policy registry
+        scope: Scope precedence passed to merge_ego_configs
+
+    Returns:
+        Tuple of (charter, merged ego config)
+    """
+    registry = _registry_for(registry_path)
+    return registry.load_charter(), registry.merge_ego_configs(list(scope))
+
+
+@lru_cache(maxsize=4)
+def _registry_for(registry_path: Path) -> PolicyRegistry:
+    """Return a long-lived registry so its per-file parse cache survives reloads.
+
+    When only one registry file changes (e.g. during `ego watch`), the other
+    files are served from the registry's cache instead of being re-parsed.
+    """
+    from .registry import PolicyRegistry
+
+    return PolicyRegistry(registry_path)
+
+
+_CONFIDENCE_COLORS = {"high": "green", "medium": "yellow", "low": "dim"}
+
+
+def _confidence_label(confidence: str) -> str:
+    """Format a pattern confidence level as a colored Rich label."""
+    color = _CONFIDENCE_COLORS.get(confidence, "dim")
+    return f"[{color}]{confidence.upper()}[/{color}]"
+
+
+def _evidence_lines(evidence: list[str]) -> list[str]:
+    """Format up to two evidence quotes, escaping any Rich markup in them."""
+    from rich.markup import escape
+
+    return [f'       [dim]→ "{escape(ev[:80])}..."[/dim]' for ev in evidence[:2]]
 
 
 def _discover_registry() -> Path | None:
@@ -819,12 +1104,18 @@ def _discover_registry() -> Path | None:
     Returns:
         Path to discovered registry or None if not found
     """
-    current = Path.cwd()
+    return _discover_registry_from(Path.cwd())
+
+
+@lru_cache(maxsize=4)
+def _discover_registry_from(start: Path) -> Path | None:
+    """Walk up from start looking for .egokit/policy-registry (cached per start)."""
+    current = start
 
     # Look up directory tree for .egokit/policy-registry
     while current != current.parent:
         registry_path = current / ".egokit" / "policy-registry"
-        if registry_path.exists() and registry_path.is_dir():
+        if registry_path.is_dir():
             return registry_path
         current = current.parent
 
@@ -833,10 +1124,12 @@ def _discover_registry() -> Path | None:
 
 def main() -> None:
     """Entry point for the CLI."""
+    import sys
+
     try:
         app()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted[/yellow]")
+        _console().print("\n[yellow]Interrupted[/yellow]")
         sys.exit(130)
 
 
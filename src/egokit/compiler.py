@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .models import (
     CompilationContext,
@@ -12,11 +14,21 @@ from .models import (
     Severity,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 # Markers for the EgoKit-managed section in AGENTS.md
 # Content between these markers is auto-generated; content outside is human-managed
 EGOKIT_BEGIN_MARKER = "<!-- BEGIN-EGOKIT-POLICIES -->"
 EGOKIT_END_MARKER = "<!-- END-EGOKIT-POLICIES -->"
 
+# Artifact path prefixes for slash commands of each supported tool
+CLAUDE_COMMANDS_PREFIX = ".claude/commands/"
+AUGMENT_COMMANDS_PREFIX = ".augment/commands/"
+
+# Rule tags that place a rule in the Code Style section of the AGENTS.md template
+_STYLE_TAGS = frozenset({"style", "formatting", "code-style", "naming", "conventions"})
+
 
 def find_egokit_section(content: str) -> tuple[int, int] | None:
     """Find the EgoKit-managed section in existing AGENTS.md content.
@@ -61,6 +73,40 @@ def extract_human_content(content: str) -> tuple[str, str]:
     return (before, after)
 
 
+def splice_egokit_section(existing_content: str, egokit_section: str) -> str:
+    """Place a compiled EgoKit section into existing AGENTS.md content.
+
+    Args:
+        existing_content: Existing AGENTS.md content
+        egokit_section: Compiled section, including its markers
+
+    Returns:
+        Content with the section between the markers replaced, or with the
+        section appended if the file has no markers (callers should confirm
+        with the user first)
+    """
+    section_bounds = find_egokit_section(existing_content)
+
+    if section_bounds is not None:
+        # Replace existing section
+        begin_idx, end_idx = section_bounds
+        before = existing_content[:begin_idx].rstrip()
+        after = existing_content[end_idx:].lstrip()
+
+        parts = [before]
+        if before:
+            parts.append("\n\n")
+        parts.append(egokit_section)
+        if after:
+            parts.append("\n\n")
+            parts.append(after)
+        return "".join(parts)
+
+    # Append section to end
+    content = existing_content.rstrip()
+    return f"{content}\n\n{egokit_section}\n"
+
+
 class ArtifactCompiler:
     """Compiles policy and ego configurations into agent-specific artifacts."""
 
@@ -82,7 +128,7 @@ class ArtifactCompiler:
         Returns:
             Markdown content for the EgoKit-managed section, including markers
         """
-        rules = self._extract_rules_from_charter()
+        buckets = self._rule_buckets
         timestamp = self.context.generation_timestamp.strftime("%Y-%m-%d")
         sections: list[str] = []
 
@@ -95,17 +141,15 @@ class ArtifactCompiler:
         ])
 
         # Policy Compliance (the binding section)
-        sections.extend(self._compile_agents_policy_compliance(rules))
+        sections.extend(self._compile_agents_policy_compliance(buckets))
 
         # Testing Instructions
-        testing_rules = [r for r in rules if "testing" in (r.tags or [])]
-        if testing_rules:
-            sections.extend(self._compile_agents_testing(testing_rules))
+        if buckets["testing"]:
+            sections.extend(self._compile_agents_testing(buckets["testing"]))
 
         # Security Considerations
-        security_rules = [r for r in rules if "security" in (r.tags or [])]
-        if security_rules:
-            sections.extend(self._compile_agents_security(security_rules))
+        if buckets["security"]:
+            sections.extend(self._compile_agents_security(buckets["security"]))
 
         # Session Protocol (opt-in)
         session = self.context.policy_charter.session
@@ -160,17 +204,17 @@ class ArtifactCompiler:
 
         if ego.defaults:
             sections.append("**Development Approach:**")
-            for key, value in ego.defaults.items():
-                readable_key = key.replace("_", " ").title()
-                sections.append(f"- {readable_key}: {value}")
+            sections.extend(
+                f"- {key.replace('_', ' ').title()}: {value}"
+                for key, value in ego.defaults.items()
+            )
             sections.append("")
 
         # Setup Commands (human-managed)
         sections.extend(self._compile_agents_setup_commands())
 
         # Code Style (human-managed with defaults from config)
-        style_rules = [r for r in self._extract_rules_from_charter()
-                       if self._has_style_tags(r)]
+        style_rules = self._rule_buckets["style"]
         if style_rules:
             sections.extend(self._compile_agents_code_style(style_rules))
         else:
@@ -212,32 +256,37 @@ class ArtifactCompiler:
         if existing_content is None:
             return self.generate_agents_md_template()
 
-        egokit_section = self.compile_egokit_section()
-        section_bounds = find_egokit_section(existing_content)
-
-        if section_bounds is not None:
-            # Replace existing section
-            begin_idx, end_idx = section_bounds
-            before = existing_content[:begin_idx].rstrip()
-            after = existing_content[end_idx:].lstrip()
-
-            parts = [before]
-            if before:
-                parts.append("\n\n")
-            parts.append(egokit_section)
-            if after:
-                parts.append("\n\n")
-                parts.append(after)
-            return "".join(parts)
-
-        # Append section to end (caller should confirm with user first)
-        content = existing_content.rstrip()
-        return f"{content}\n\n{egokit_section}\n"
-
-    def _has_style_tags(self, rule: PolicyRule) -> bool:
-        """Check if rule has style-related tags."""
-        style_tags = {"style", "formatting", "code-style", "naming", "conventions"}
-        return bool(set(rule.tags or []) & style_tags)
+        return splice_egokit_section(existing_content, self.compile_egokit_section())
+
+    @cached_property
+    def _rules(self) -> list[PolicyRule]:
+        """Rules extracted from the charter, computed once per compiler."""
+        return self._extract_rules_from_charter()
+
+    @cached_property
+    def _rule_buckets(self) -> dict[str, list[PolicyRule]]:
+        """Rules partitioned by severity and by section tag in a single pass.
+
+        Keys are the severity values ("critical", "warning", "info") plus
+        "testing", "security" and "style". Rule order is preserved within
+        each bucket.
+        """
+        buckets: dict[str, list[PolicyRule]] = {
+            **{severity.value: [] for severity in Severity},
+            "testing": [],
+            "security": [],
+            "style": [],
+        }
+        for rule in self._rules:
+            buckets[rule.severity.value].append(rule)
+            tags = frozenset(rule.tags or ())
+            if "testing" in tags:
+                buckets["testing"].append(rule)
+            if "security" in tags:
+                buckets["security"].append(rule)
+            if not tags.isdisjoint(_STYLE_TAGS):
+                buckets["style"].append(rule)
+        return buckets
 
     def _extract_rules_from_charter(self) -> list[PolicyRule]:
         """Extract all rules from the policy charter."""
@@ -280,9 +329,10 @@ class ArtifactCompiler:
 
         if ego.defaults:
             sections.append("**Development Approach:**")
-            for key, value in ego.defaults.items():
-                readable_key = key.replace("_", " ").title()
-                sections.append(f"- {readable_key}: {value}")
+            sections.extend(
+                f"- {key.replace('_', ' ').title()}: {value}"
+                for key, value in ego.defaults.items()
+            )
             sections.append("")
 
         return sections
@@ -299,8 +349,10 @@ class ArtifactCompiler:
         if "setup" in metadata:
             setup = metadata["setup"]
             if isinstance(setup, dict):
-                for cmd_name, cmd_value in setup.items():
-                    sections.append(f"- **{cmd_name.title()}:** `{cmd_value}`")
+                sections.extend(
+                    f"- **{cmd_name.title()}:** `{cmd_value}`"
+                    for cmd_name, cmd_value in setup.items()
+                )
             sections.append("")
         else:
             # Provide sensible defaults
@@ -330,21 +382,22 @@ class ArtifactCompiler:
         # Add formatting preferences from ego config
         if self.context.ego_config.tone.formatting:
             sections.append("**Formatting Preferences:**")
-            for pref in self.context.ego_config.tone.formatting:
-                sections.append(f"- {pref}")
+            sections.extend(f"- {pref}" for pref in self.context.ego_config.tone.formatting)
             sections.append("")
 
         return sections
 
-    def _compile_agents_policy_compliance(self, rules: list[PolicyRule]) -> list[str]:
+    def _compile_agents_policy_compliance(
+        self, buckets: dict[str, list[PolicyRule]],
+    ) -> list[str]:
         """Generate Policy Compliance section for AGENTS.md.
 
         This section contains the binding policy language that replaces
         system prompt fragment injection.
         """
-        critical_rules = [r for r in rules if r.severity == Severity.CRITICAL]
-        warning_rules = [r for r in rules if r.severity == Severity.WARNING]
-        info_rules = [r for r in rules if r.severity == Severity.INFO]
+        critical_rules = buckets[Severity.CRITICAL.value]
+        warning_rules = buckets[Severity.WARNING.value]
+        info_rules = buckets[Severity.INFO.value]
 
         sections = [
             "## Policy Compliance",
@@ -377,8 +430,7 @@ class ArtifactCompiler:
                 "Follow these guidelines for code quality:",
                 "",
             ])
-            for rule in warning_rules:
-                sections.append(f"- **{rule.id}:** {rule.rule}")
+            sections.extend(f"- **{rule.id}:** {rule.rule}" for rule in warning_rules)
             sections.append("")
 
         if info_rules:
@@ -388,8 +440,7 @@ class ArtifactCompiler:
                 "Consider these best practices:",
                 "",
             ])
-            for rule in info_rules:
-                sections.append(f"- **{rule.id}:** {rule.rule}")
+            sections.extend(f"- **{rule.id}:** {rule.rule}" for rule in info_rules)
             sections.append("")
 
         return sections
@@ -401,8 +452,7 @@ class ArtifactCompiler:
             "",
         ]
 
-        for rule in testing_rules:
-            sections.append(f"- {rule.rule}")
+        sections.extend(f"- {rule.rule}" for rule in testing_rules)
 
         sections.append("")
         return sections
@@ -416,9 +466,10 @@ class ArtifactCompiler:
             "",
         ]
 
-        for rule in security_rules:
-            severity_marker = "🔴" if rule.severity == Severity.CRITICAL else "🟡"
-            sections.append(f"- {severity_marker} **{rule.id}:** {rule.rule}")
+        sections.extend(
+            f"- {'🔴' if rule.severity == Severity.CRITICAL else '🟡'} **{rule.id}:** {rule.rule}"
+            for rule in security_rules
+        )
 
         sections.append("")
         return sections
@@ -443,16 +494,14 @@ class ArtifactCompiler:
         # Startup: Read context files
         if session.startup.read:
             sections.append("1. **Read context files** (in order):")
-            for file_path in session.startup.read:
-                sections.append(f"   - `{file_path}`")
+            sections.extend(f"   - `{file_path}`" for file_path in session.startup.read)
             sections.append("")
 
         # Startup: Run orientation commands
         if session.startup.run:
             sections.append("2. **Check repository state**:")
             sections.append("   ```bash")
-            for cmd in session.startup.run:
-                sections.append(f"   {cmd}")
+            sections.extend(f"   {cmd}" for cmd in session.startup.run)
             sections.append("   ```")
             sections.append("")
 
@@ -584,8 +633,8 @@ class ArtifactCompiler:
         # Generate slash commands for both tool directories
         commands = self.compile_slash_commands()
         for cmd_name, cmd_content in commands.items():
-            artifacts[f".claude/commands/{cmd_name}"] = cmd_content
-            artifacts[f".augment/commands/{cmd_name}"] = cmd_content
+            artifacts[CLAUDE_COMMANDS_PREFIX + cmd_name] = cmd_content
+            artifacts[AUGMENT_COMMANDS_PREFIX + cmd_name] = cmd_content
 
         return artifacts
 
@@ -1010,17 +1059,13 @@ If this is a new session or context window:
 """
             # Add files to read
             if session.startup.read:
-                session_section += "**Read context files:**\n"
-                for file_path in session.startup.read:
-                    session_section += f"- `{file_path}`\n"
-                session_section += "\n"
+                read_list = "".join(f"- `{file_path}`\n" for file_path in session.startup.read)
+                session_section += f"**Read context files:**\n{read_list}\n"
 
             # Add commands to run
             if session.startup.run:
-                session_section += "**Check repository state:**\n```bash\n"
-                for cmd in session.startup.run:
-                    session_section += f"{cmd}\n"
-                session_section += "```\n\n"
+                run_list = "".join(f"{cmd}\n" for cmd in session.startup.run)
+                session_section += f"**Check repository state:**\n```bash\n{run_list}```\n\n"
 
             session_section += (
                 "**Verify:**\n"
@@ -1197,8 +1242,7 @@ class ArtifactInjector:
     """Injects compiled artifacts into target repositories.
 
     This class provides a simple interface for writing artifacts to disk.
-    The CLI uses direct file writing, but this class is kept for backward
-    compatibility with existing code that may depend on it.
+    `ego watch` keeps one injector per monitored project across syncs.
     """
 
     def __init__(self, target_repo: Path) -> None:
@@ -1209,13 +1253,44 @@ class ArtifactInjector:
         """
         self.target_repo = Path(target_repo)
 
-    def inject_artifacts(self, artifacts: dict[str, str]) -> None:
+    def inject_artifacts(self, artifacts: Mapping[str, str | bytes]) -> int:
         """Write artifacts to the target repository.
 
+        Files whose current content already matches are left untouched, so
+        re-applying unchanged policies does not disturb editors, file
+        watchers or git.
+
         Args:
-            artifacts: Dictionary mapping relative paths to content
+            artifacts: Dictionary mapping relative paths to content. Text is
+                written as UTF-8; bytes are written unchanged.
+
+        Returns:
+            Number of files that were created or rewritten
         """
+        # Most artifacts share a handful of command directories
+        for parent in {(self.target_repo / path).parent for path in artifacts}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        written = 0
         for artifact_path, content in artifacts.items():
-            target_path = self.target_repo / artifact_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            target_path.write_text(content, encoding="utf-8")
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            if _write_if_changed(self.target_repo / artifact_path, data):
+                written += 1
+        return written
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly those bytes.
+
+    The size check avoids reading files that obviously differ.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
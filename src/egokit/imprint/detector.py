@@ -77,6 +77,37 @@ POLICY_ID_PATTERN = re.compile(r"\b([A-Z]{2,6}-\d{3})\b")
 # Maximum evidence examples to keep per pattern
 MAX_EVIDENCE_EXAMPLES = 5
 
+# Topic keywords for categorizing corrections, checked in order
+CORRECTION_CATEGORY_KEYWORDS = {
+    "type_hints": ["type", "typing", "hint", "annotation", "list[", "dict["],
+    "imports": ["import", "from ", "module"],
+    "docstrings": ["docstring", "documentation", "google style", "numpy style"],
+    "naming": ["name", "naming", "snake_case", "camelcase", "variable"],
+    "testing": ["test", "testing", "pytest", "unittest"],
+    "formatting": ["format", "indent", "spacing", "line length"],
+}
+
+# One literal alternation per category, matched against lowercased text
+_CORRECTION_CATEGORY_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in CORRECTION_CATEGORY_KEYWORDS.items()
+}
+
+
+def _compile_any(patterns: list[str]) -> re.Pattern[str]:
+    """Compile patterns into one alternation that matches wherever any of them does.
+
+    A single search over the combined pattern replaces one search per pattern.
+    Leading global (?i) flags become scoped (?i:...) groups, since global flags
+    are only allowed at the start of the combined expression.
+    """
+    parts = [
+        f"(?i:{pattern.removeprefix('(?i)')})" if pattern.startswith("(?i)")
+        else f"(?:{pattern})"
+        for pattern in patterns
+    ]
+    return re.compile("|".join(parts))
+
 
 @dataclass
 class DetectorConfig:
@@ -105,16 +136,16 @@ class PatternDetector:
             config: Detection configuration, uses defaults if not provided
         """
         self.config = config or DetectorConfig()
-        self._correction_patterns = [re.compile(p) for p in CORRECTION_INDICATORS]
+        self._correction_pattern = _compile_any(CORRECTION_INDICATORS)
         self._style_patterns = {
-            category: [re.compile(p) for p in patterns]
+            category: _compile_any(patterns)
             for category, patterns in STYLE_PATTERNS.items()
         }
-        self._noise_patterns = [re.compile(p) for p in SYSTEM_NOISE_PATTERNS]
+        self._noise_pattern = _compile_any(SYSTEM_NOISE_PATTERNS)
 
     def _is_system_noise(self, text: str) -> bool:
         """Check if message appears to be system-injected content, not real user input."""
-        return any(pattern.search(text) for pattern in self._noise_patterns)
+        return self._noise_pattern.search(text) is not None
 
     def _get_user_content(self, sessions: list[Session]) -> list[tuple[str, str]]:
         """Extract real user messages, filtering out system noise.
@@ -138,9 +169,16 @@ class PatternDetector:
         Returns:
             List of detected correction patterns
         """
+        return self._corrections_from(self._get_user_content(sessions))
+
+    def _corrections_from(
+        self,
+        user_content: list[tuple[str, str]],
+    ) -> list[CorrectionPattern]:
+        """Detect correction patterns from pre-filtered user messages."""
         corrections: list[tuple[str, str, str]] = []  # (category, quote, session_id)
 
-        for content, session_id in self._get_user_content(sessions):
+        for content, session_id in user_content:
             if self._is_correction(content):
                 category = self._categorize_correction(content)
                 # Take first 200 chars as evidence quote
@@ -151,24 +189,14 @@ class PatternDetector:
 
     def _is_correction(self, text: str) -> bool:
         """Check if a message appears to be a correction."""
-        return any(pattern.search(text) for pattern in self._correction_patterns)
+        return self._correction_pattern.search(text) is not None
 
     def _categorize_correction(self, text: str) -> str:
         """Categorize a correction into a topic area."""
         text_lower = text.lower()
 
-        # Category keywords mapping
-        categories = {
-            "type_hints": ["type", "typing", "hint", "annotation", "list[", "dict["],
-            "imports": ["import", "from ", "module"],
-            "docstrings": ["docstring", "documentation", "google style", "numpy style"],
-            "naming": ["name", "naming", "snake_case", "camelcase", "variable"],
-            "testing": ["test", "testing", "pytest", "unittest"],
-            "formatting": ["format", "indent", "spacing", "line length"],
-        }
-
-        for category, keywords in categories.items():
-            if any(term in text_lower for term in keywords):
+        for category, pattern in _CORRECTION_CATEGORY_PATTERNS.items():
+            if pattern.search(text_lower):
                 return category
 
         return "general"
@@ -191,7 +219,7 @@ class PatternDetector:
                 continue
 
             confidence = self._get_confidence(count)
-            unique_sessions = list({sid for _, sid in items})
+            unique_sessions = list(dict.fromkeys(sid for _, sid in items))
             evidence = [quote for quote, _ in items[:5]]  # Keep up to 5 examples
 
             patterns.append(CorrectionPattern(
@@ -225,17 +253,23 @@ class PatternDetector:
         Returns:
             List of detected style preferences
         """
+        return self._style_preferences_from(self._get_user_content(sessions))
+
+    def _style_preferences_from(
+        self,
+        user_content: list[tuple[str, str]],
+    ) -> list[StylePreference]:
+        """Detect style preferences from pre-filtered user messages."""
         preferences: dict[str, list[tuple[str, str]]] = {}  # category -> [(quote, session_id)]
 
-        for content, session_id in self._get_user_content(sessions):
-            for category, patterns in self._style_patterns.items():
-                for pattern in patterns:
-                    if pattern.search(content):
-                        if category not in preferences:
-                            preferences[category] = []
-                        quote = content[:200].strip()
-                        preferences[category].append((quote, session_id))
-                        break  # Only count once per category per message
+        for content, session_id in user_content:
+            for category, pattern in self._style_patterns.items():
+                # Counted at most once per category per message
+                if pattern.search(content):
+                    if category not in preferences:
+                        preferences[category] = []
+                    quote = content[:200].strip()
+                    preferences[category].append((quote, session_id))
 
         results: list[StylePreference] = []
         for category, items in preferences.items():
@@ -244,7 +278,7 @@ class PatternDetector:
                 continue
 
             confidence = self._get_confidence(count)
-            unique_sessions = list({sid for _, sid in items})
+            unique_sessions = list(dict.fromkeys(sid for _, sid in items))
             evidence = [quote for quote, _ in items[:5]]
 
             results.append(StylePreference(
@@ -282,11 +316,21 @@ class PatternDetector:
         Returns:
             List of detected implicit patterns
         """
+        return self._implicit_patterns_from(
+            self._get_user_content(sessions), len(sessions),
+        )
+
+    def _implicit_patterns_from(
+        self,
+        user_content: list[tuple[str, str]],
+        session_count: int,
+    ) -> list[ImplicitPattern]:
+        """Detect implicit patterns from pre-filtered user messages."""
         # Track policy ID mentions (only from real user content)
         policy_mentions: Counter[str] = Counter()
         policy_evidence: dict[str, list[str]] = {}
 
-        for content, _session_id in self._get_user_content(sessions):
+        for content, _session_id in user_content:
             for match in POLICY_ID_PATTERN.finditer(content):
                 policy_id = match.group(1)
                 policy_mentions[policy_id] += 1
@@ -305,7 +349,7 @@ class PatternDetector:
             patterns.append(ImplicitPattern(
                 pattern_type="policy_reference",
                 description=f"User references policy {policy_id} - consider reinforcing",
-                frequency=count / len(sessions) if sessions else 0.0,
+                frequency=count / session_count if session_count else 0.0,
                 occurrences=count,
                 confidence=self._get_confidence(count),
                 evidence=policy_evidence.get(policy_id, []),
@@ -325,8 +369,10 @@ class PatternDetector:
         Returns:
             Tuple of (corrections, style_preferences, implicit_patterns)
         """
-        corrections = self.detect_corrections(sessions)
-        style_prefs = self.detect_style_preferences(sessions)
-        implicit = self.detect_implicit_patterns(sessions)
+        # Filter system noise once rather than once per detector
+        user_content = self._get_user_content(sessions)
+        corrections = self._corrections_from(user_content)
+        style_prefs = self._style_preferences_from(user_content)
+        implicit = self._implicit_patterns_from(user_content, len(sessions))
 
         return corrections, style_prefs, implicit
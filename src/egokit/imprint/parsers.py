@@ -1,26 +1,63 @@
 """Log parsers for Claude Code and Augment session formats.
 
-Pure Python stdlib implementation - no external dependencies.
+Pure Python stdlib implementation - no external dependencies. If orjson is
+installed it is used to decode JSONL lines and JSON exports, which dominates
+parsing time.
 Parses JSONL (Claude Code) and JSON (Augment) formats into normalized Session objects.
 """
 
 from __future__ import annotations
 
 import json
+import os
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .models import Message, MessageRole, Session
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    _loads_json: Callable[[bytes], Any] = json.loads
+else:
+    _loads_json = orjson.loads
 
 # Threshold for detecting millisecond timestamps (timestamps after year ~2001 in ms)
 MILLISECOND_TIMESTAMP_THRESHOLD = 1e12
 
 
+def _scan_files(root: Path, suffix: str, *, recursive: bool) -> Iterator[Path]:
+    """Yield files under root whose name ends with suffix.
+
+    Uses a single os.scandir pass per directory; DirEntry caches the file
+    type, so each entry is stat'ed at most once. Symlinked directories are
+    not followed, matching Path.rglob.
+
+    Args:
+        root: Directory to scan
+        suffix: File suffix to match, including the dot (e.g. ".jsonl")
+        recursive: Whether to descend into subdirectories
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 class LogParser(ABC):
     """Abstract base class for session log parsers."""
 
@@ -69,7 +106,7 @@ class ClaudeCodeParser(LogParser):
         if not search_root.exists():
             return []
 
-        return list(search_root.rglob("*.jsonl"))
+        return list(_scan_files(search_root, ".jsonl", recursive=True))
 
     def parse(self, path: Path) -> Iterator[Session]:
         """Parse a Claude Code JSONL log file.
@@ -87,15 +124,17 @@ class ClaudeCodeParser(LogParser):
         start_time: datetime | None = None
         end_time: datetime | None = None
 
-        with path.open(encoding="utf-8") as f:
+        # Lines are decoded as bytes; both decoders accept UTF-8 input directly
+        with path.open("rb") as f:
             for raw_line in f:
                 line = raw_line.strip()
                 if not line:
                     continue
 
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+                    entry = _loads_json(line)
+                except ValueError:
+                    # Malformed JSON or invalid UTF-8 on this line
                     continue
 
                 msg = self._parse_entry(entry)
@@ -211,38 +250,18 @@ class AugmentParser(LogParser):
                 return [root]
             return []
 
-        # Look for files that match Augment export patterns
-        candidates: list[Path] = []
-
-        # Common patterns for Augment exports (including timestamp exports)
-        patterns = [
-            "*Augment*.json",
-            "*augment*.json",
-            "conversation*.json",
-            "*_2025-*.json",  # Timestamp pattern: _2025-12-01T...
-            "*_2024-*.json",
+        # Exports have no fixed naming scheme, so every top-level .json file
+        # is a candidate; one directory scan replaces per-pattern globbing.
+        return [
+            path
+            for path in _scan_files(root, ".json", recursive=False)
+            if self._is_augment_export(path)
         ]
-        for pattern in patterns:
-            candidates.extend(root.glob(pattern))
-
-        # Also check all .json files for valid Augment format
-        for json_file in root.glob("*.json"):
-            if json_file not in candidates:
-                candidates.append(json_file)
-
-        # Filter to only valid Augment exports
-        valid_files: list[Path] = []
-        for path in candidates:
-            if self._is_augment_export(path):
-                valid_files.append(path)
-
-        return valid_files
 
     def _is_augment_export(self, path: Path) -> bool:
         """Check if a JSON file is a valid Augment export."""
         try:
-            with path.open(encoding="utf-8") as f:
-                data = json.load(f)
+            data = _loads_json(path.read_bytes())
             # Augment exports have chatHistory - either at root or nested in conversation
             if not isinstance(data, dict):
                 return False
@@ -251,7 +270,7 @@ class AugmentParser(LogParser):
             # Check for nested structure: {conversation: {chatHistory: [...]}}
             conv = data.get("conversation", {})
             return isinstance(conv, dict) and "chatHistory" in conv
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             return False
 
     def _extract_chat_history(self, data: dict[str, object]) -> list[object]:
@@ -284,9 +303,8 @@ class AugmentParser(LogParser):
             return
 
         try:
-            with path.open(encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            data = _loads_json(path.read_bytes())
+        except (ValueError, OSError):
             return
 
         if not isinstance(data, dict):
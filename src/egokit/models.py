@@ -10,6 +10,11 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+# Validator patterns, compiled once since every loaded rule and charter is checked
+_RULE_ID_RE = re.compile(r"^[A-Z]{2,6}-\d{3}$")
+_DETECTOR_NAME_RE = re.compile(r"^[a-z_.]+\.v\d+$")
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(?:-[a-zA-Z0-9\-]+)?(?:\+[a-zA-Z0-9\-]+)?$")
+
 
 class Severity(str, Enum):
     """Policy rule severity levels."""
@@ -47,7 +52,7 @@ class PolicyRule(BaseModel):
     @classmethod
     def validate_id_format(cls, v: str) -> str:
         """Validate rule ID follows expected format."""
-        if not re.match(r"^[A-Z]{2,6}-\d{3}$", v):
+        if not _RULE_ID_RE.match(v):
             msg = "Rule ID must follow format: PREFIX-NNN (e.g., SEC-001)"
             raise ValueError(msg)
         return v
@@ -56,7 +61,7 @@ class PolicyRule(BaseModel):
     @classmethod
     def validate_detector_name(cls, v: str) -> str:
         """Validate detector name follows versioning convention."""
-        if not re.match(r"^[a-z_.]+\.v\d+$", v):
+        if not _DETECTOR_NAME_RE.match(v):
             msg = "Detector must follow format: name.v1 (e.g., secret.regex.v1)"
             raise ValueError(msg)
         return v
@@ -144,8 +149,7 @@ class PolicyCharter(BaseModel):
     @classmethod
     def validate_semver(cls, v: str) -> str:
         """Validate version follows semantic versioning."""
-        semver_pattern = r"^\d+\.\d+\.\d+(?:-[a-zA-Z0-9\-]+)?(?:\+[a-zA-Z0-9\-]+)?$"
-        if not re.match(semver_pattern, v):
+        if not _SEMVER_RE.match(v):
             msg = "Version must follow semantic versioning (e.g., 1.2.0)"
             raise ValueError(msg)
         return v
@@ -161,8 +165,7 @@ class EgoCharter(BaseModel):
     @classmethod
     def validate_semver(cls, v: str) -> str:
         """Validate version follows semantic versioning."""
-        semver_pattern = r"^\d+\.\d+\.\d+(?:-[a-zA-Z0-9\-]+)?(?:\+[a-zA-Z0-9\-]+)?$"
-        if not re.match(semver_pattern, v):
+        if not _SEMVER_RE.match(v):
             msg = "Version must follow semantic versioning (e.g., 1.0.0)"
             raise ValueError(msg)
         return v
@@ -13,6 +13,13 @@ from pydantic import ValidationError
 from .exceptions import PolicyValidationError, RegistryError, ScopeError
 from .models import EgoCharter, EgoConfig, PolicyCharter, PolicyRule
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only have
+# the pure-Python one, which parses the same documents far more slowly.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class PolicyRegistry:
     """Loads, validates, and manages policy and ego configurations."""
@@ -24,24 +31,56 @@ class PolicyRegistry:
             registry_root: Path to .egokit/policy-registry directory
         """
         self.root = Path(registry_root)
-        self._schema_cache: dict[str, dict[str, Any]] = {}
+        # Parsed file contents keyed by path, each stored with the raw bytes it
+        # was parsed from. Comparing contents rather than (mtime, size) means a
+        # same-size edit within one timestamp tick is never served stale.
+        self._schema_cache: dict[str, tuple[bytes, dict[str, Any]]] = {}
+        self._yaml_cache: dict[Path, tuple[bytes, Any]] = {}
 
     def _load_schema(self, schema_name: str) -> dict[str, Any]:
         """Load and cache JSON schema."""
-        if schema_name not in self._schema_cache:
-            schema_path = self.root / "schemas" / f"{schema_name}.schema.json"
-            if not schema_path.exists():
-                msg = f"Schema file not found: {schema_path}"
-                raise RegistryError(msg)
+        schema_path = self.root / "schemas" / f"{schema_name}.schema.json"
+        try:
+            content = schema_path.read_bytes()
+        except FileNotFoundError:
+            msg = f"Schema file not found: {schema_path}"
+            raise RegistryError(msg) from None
+        except OSError as e:
+            msg = f"Failed to load schema {schema_name}: {e}"
+            raise RegistryError(msg) from e
 
-            try:
-                with schema_path.open(encoding="utf-8") as f:
-                    self._schema_cache[schema_name] = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
-                msg = f"Failed to load schema {schema_name}: {e}"
-                raise RegistryError(msg) from e
+        cached = self._schema_cache.get(schema_name)
+        if cached is not None and cached[0] == content:
+            return cached[1]
+
+        try:
+            schema: dict[str, Any] = json.loads(content)
+        except json.JSONDecodeError as e:
+            msg = f"Failed to load schema {schema_name}: {e}"
+            raise RegistryError(msg) from e
+
+        self._schema_cache[schema_name] = (content, schema)
+        return schema
+
+    def _load_yaml(self, path: Path) -> Any:  # noqa: ANN401
+        """Parse a YAML file, reusing the previous result while it is unchanged.
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        with path.open("rb") as f:
+            content = f.read()
+            cached = self._yaml_cache.get(path)
+            if cached is not None and cached[0] == content:
+                return cached[1]
+
+            # Parse from the open file so YAML errors name it rather than "<byte string>"
+            f.seek(0)
+            data = yaml.load(f, Loader=_YamlLoader)
 
-        return self._schema_cache[schema_name]
+        self._yaml_cache[path] = (content, data)
+        return data
 
     def _validate_yaml_against_schema(
         self,
@@ -79,8 +118,7 @@ class PolicyRegistry:
             raise RegistryError(msg)
 
         try:
-            with charter_path.open(encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml(charter_path)
         except yaml.YAMLError as e:
             msg = f"Failed to parse charter YAML: {e}"
             raise RegistryError(msg) from e
@@ -121,8 +159,7 @@ class PolicyRegistry:
             raise RegistryError(msg)
 
         try:
-            with ego_path.open(encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml(ego_path)
         except yaml.YAMLError as e:
             msg = f"Failed to parse ego YAML: {e}"
             raise RegistryError(msg) from e
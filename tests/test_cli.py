@@ -1,14 +1,34 @@
 """Tests for CLI commands and integration."""
 
 import json
+import os
+import subprocess
+import sys
 import tempfile
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
 
 import pytest
 import yaml
 from typer.testing import CliRunner
 
-from egokit.cli import _discover_registry, app
+from egokit.cli import (
+    _collect_recent_sessions,
+    _discover_projects,
+    _discover_registry,
+    _is_registry_input,
+    _load_registry_cached,
+    _read_text,
+    _registry_stamp,
+    _sync_if_changed,
+    _sync_projects,
+    _watch_with_events,
+    _watch_with_polling,
+    app,
+)
+from egokit.compiler import EGOKIT_BEGIN_MARKER, EGOKIT_END_MARKER, ArtifactInjector
+from egokit.imprint import ClaudeCodeParser
 
 
 class TestCLI:
@@ -200,6 +220,31 @@ class TestCLI:
         assert not (temp_repo / ".claude").exists()
         assert not (temp_repo / ".augment").exists()
 
+    def test_apply_dry_run_preview_is_not_rich_markup(
+        self,
+        runner: CliRunner,
+        temp_registry: Path,
+        temp_repo: Path,
+    ) -> None:
+        """Test dry-run previews print artifact text verbatim."""
+        charter_path = temp_registry / "charter.yaml"
+        charter = yaml.safe_load(charter_path.read_text())
+        charter["scopes"]["global"]["security"][0]["rule"] = "Never log [bold]secrets[/bold]"
+        charter_path.write_text(yaml.dump(charter))
+        (temp_repo / "AGENTS.md").write_text(
+            "<!-- BEGIN-EGOKIT-POLICIES -->\n<!-- END-EGOKIT-POLICIES -->\n",
+        )
+
+        result = runner.invoke(app, [
+            "apply",
+            "--repo", str(temp_repo),
+            "--registry", str(temp_registry),
+            "--dry-run",
+        ])
+
+        assert result.exit_code == 0
+        assert "Never log [bold]secrets[/bold]" in result.stdout
+
     def test_doctor_command(
         self,
         runner: CliRunner,
@@ -218,6 +263,19 @@ class TestCLI:
         assert "Active Rules" in result.stdout
         assert "SEC-001" in result.stdout
 
+    def test_doctor_reports_unreadable_charter(
+        self,
+        runner: CliRunner,
+        temp_registry: Path,
+    ) -> None:
+        """Test doctor reports a broken charter during scope auto-detection."""
+        (temp_registry / "charter.yaml").write_text("version: [unclosed\n")
+
+        result = runner.invoke(app, ["doctor", "--registry", str(temp_registry)])
+
+        assert result.exit_code == 1
+        assert "Failed to parse charter YAML" in result.stdout
+
     def test_discover_registry_finds_local(self) -> None:
         """Test registry discovery in directory hierarchy."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -258,6 +316,247 @@ class TestCLI:
             finally:
                 os.chdir(original_cwd)
 
+    def test_load_registry_cached_reuses_until_charter_changes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_registry: Path,
+    ) -> None:
+        """Test that registry loads re-parse only after an input file changes."""
+        parsed: list[str] = []
+        real_load = yaml.load
+
+        def counting_load(stream: BinaryIO, Loader: type) -> object:  # noqa: N803
+            parsed.append(Path(stream.name).name)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr("egokit.registry.yaml.load", counting_load)
+
+        charter, ego_config = _load_registry_cached(temp_registry, ("global",))
+        cached_charter, cached_ego = _load_registry_cached(temp_registry, ("global",))
+        assert cached_charter == charter
+        assert cached_ego == ego_config
+        assert sorted(parsed) == ["charter.yaml", "global.yaml"]
+
+        charter_path = temp_registry / "charter.yaml"
+        charter_path.write_text(charter_path.read_text().replace("1.0.0", "10.0.0"))
+
+        reloaded_charter, _ = _load_registry_cached(temp_registry, ("global",))
+        assert reloaded_charter.version == "10.0.0"
+        assert sorted(parsed) == ["charter.yaml", "charter.yaml", "global.yaml"]
+
+    def test_discover_projects_prunes_heavy_directories(self) -> None:
+        """Test project discovery finds markers and skips dependency dirs."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "service").mkdir()
+            (root / "service" / "AGENTS.md").write_text("# AGENTS.md")
+            (root / "tool" / ".claude").mkdir(parents=True)
+            (root / "node_modules" / "pkg").mkdir(parents=True)
+            (root / "node_modules" / "pkg" / "AGENTS.md").write_text("# AGENTS.md")
+            (root / "target" / "debug").mkdir(parents=True)
+            (root / "target" / "debug" / "AGENTS.md").write_text("# AGENTS.md")
+
+            projects = _discover_projects(root)
+
+            assert sorted(p.name for p in projects) == ["service", "tool"]
+
+    def test_registry_stamp_tracks_nested_file_edits(self, temp_registry: Path) -> None:
+        """Test that editing an ego file in place changes the registry stamp."""
+        ego_file = temp_registry / "ego" / "global.yaml"
+        stamp = _registry_stamp(temp_registry)
+        assert stamp is not None
+
+        os.utime(ego_file, ns=(stamp + 1_000_000_000, stamp + 1_000_000_000))
+
+        assert _registry_stamp(temp_registry) == stamp + 1_000_000_000
+        assert _registry_stamp(temp_registry / "missing") is None
+
+    def test_collect_recent_sessions_skips_stale_logs(self, tmp_path: Path) -> None:
+        """Test that logs last written before the cutoff are not parsed."""
+        now = datetime.now(tz=UTC)
+        entry = {"type": "human", "message": {"content": "Hi"}, "timestamp": now.isoformat()}
+        fresh = tmp_path / "fresh.jsonl"
+        stale = tmp_path / "stale.jsonl"
+        for log_file in (fresh, stale):
+            log_file.write_text(json.dumps(entry) + "\n")
+        old = (now - timedelta(days=90)).timestamp()
+        os.utime(stale, (old, old))
+
+        sessions = _collect_recent_sessions(
+            ClaudeCodeParser(), tmp_path, now - timedelta(days=30),
+        )
+
+        assert [session.session_id for session in sessions] == ["fresh"]
+
+    def test_read_text_normalizes_newlines(self, tmp_path: Path) -> None:
+        """Test that reads match Path.read_text universal-newline handling."""
+        path = tmp_path / "AGENTS.md"
+        path.write_bytes("# Tïtle\r\nbody\rend\n".encode())
+
+        assert _read_text(path) == path.read_text(encoding="utf-8") == "# Tïtle\nbody\nend\n"
+
+    def test_registry_input_filter_ignores_editor_files(self) -> None:
+        """Test that only files the registry loads count as watch changes."""
+        assert _is_registry_input("/reg/charter.yaml")
+        assert _is_registry_input("/reg/schemas/ego.schema.json")
+        assert not _is_registry_input("/reg/.charter.yaml.swp")
+        assert not _is_registry_input("/reg/ego/global.yaml~")
+        assert not _is_registry_input("/reg/ego")
+
+    @pytest.mark.parametrize(("edit_content", "expect_sync"), [(True, True), (False, False)])
+    def test_watch_polling_syncs_only_on_content_change(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_registry: Path,
+        temp_repo: Path,
+        edit_content: bool,
+        expect_sync: bool,
+    ) -> None:
+        """Test that polling syncs after an in-place edit but not after a bare touch."""
+        charter_path = temp_registry / "charter.yaml"
+        ticks = iter(range(2))
+
+        def fake_sleep(_seconds: float) -> None:
+            if next(ticks, None) is None:
+                raise KeyboardInterrupt
+            if edit_content:
+                charter_path.write_text(charter_path.read_text().replace("1.0.0", "1.0.1"))
+            stamp = charter_path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(charter_path, ns=(stamp, stamp))
+
+        monkeypatch.setattr("egokit.cli.time.sleep", fake_sleep)
+
+        _watch_with_polling({temp_repo: ArtifactInjector(temp_repo)}, temp_registry, 1)
+
+        assert (temp_repo / "AGENTS.md").exists() is expect_sync
+
+    def test_watch_events_sync_once_per_edit_burst(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_registry: Path,
+        temp_repo: Path,
+    ) -> None:
+        """Test that a burst of registry writes triggers exactly one event-driven sync."""
+        pytest.importorskip("watchdog")
+        charter_path = temp_registry / "charter.yaml"
+        synced: list[str] = []
+        monkeypatch.setattr(
+            "egokit.cli._sync_projects",
+            lambda _injectors, charter, _ego_config: synced.append(charter.version),
+        )
+
+        from watchdog.events import (
+            FileModifiedEvent,
+            FileOpenedEvent,
+            FileSystemEventHandler,
+        )
+
+        class BurstObserver:
+            """Deliver one edit burst synchronously, then report itself stopped."""
+
+            def __init__(self) -> None:
+                self.handler: FileSystemEventHandler | None = None
+                self.alive_checks = 0
+
+            def schedule(self, handler: FileSystemEventHandler, path: str, *, recursive: bool) -> None:
+                assert path == str(temp_registry)
+                assert recursive
+                self.handler = handler
+
+            def start(self) -> None:
+                assert self.handler is not None
+                charter = str(charter_path)
+                self.handler.on_any_event(FileModifiedEvent(str(temp_registry / ".charter.yaml.swp")))
+                for n in range(1, 4):
+                    charter_path.write_text(charter_path.read_text().replace(f"1.{n - 1}.0", f"1.{n}.0"))
+                    self.handler.on_any_event(FileModifiedEvent(charter))
+                # Reads by the sync itself must not queue another one
+                self.handler.on_any_event(FileOpenedEvent(charter))
+
+            def is_alive(self) -> bool:
+                # Alive for one pass of the loop, which drains the whole burst
+                self.alive_checks += 1
+                return self.alive_checks == 1
+
+            def stop(self) -> None:
+                pass
+
+            def join(self) -> None:
+                pass
+
+        monkeypatch.setattr("watchdog.observers.Observer", BurstObserver)
+        monkeypatch.setattr("egokit.cli._WATCH_DEBOUNCE_SECONDS", 0)
+
+        watched = _watch_with_events({temp_repo: ArtifactInjector(temp_repo)}, temp_registry)
+
+        assert watched is True
+        assert synced == ["1.3.0"]
+
+    def test_sync_picks_up_edit_that_keeps_size_and_mtime(
+        self,
+        temp_registry: Path,
+        temp_repo: Path,
+    ) -> None:
+        """Test that a same-size edit within one mtime tick is not served stale."""
+        injectors = {temp_repo: ArtifactInjector(temp_repo)}
+        charter_path = temp_registry / "charter.yaml"
+        loaded = _sync_if_changed(injectors, temp_registry, None)
+        assert "SEC-001" in (temp_repo / "AGENTS.md").read_text()
+
+        stat = charter_path.stat()
+        charter_path.write_text(charter_path.read_text().replace("SEC-001", "SEC-009"))
+        os.utime(charter_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert charter_path.stat().st_size == stat.st_size
+
+        _sync_if_changed(injectors, temp_registry, loaded)
+
+        agents_md = (temp_repo / "AGENTS.md").read_text()
+        assert "SEC-009" in agents_md
+        assert "SEC-001" not in agents_md
+
+    def test_sync_projects_writes_artifacts(
+        self,
+        temp_registry: Path,
+        temp_repo: Path,
+    ) -> None:
+        """Test that watch sync writes AGENTS.md and commands to every project."""
+        other_repo = temp_repo / "nested"
+        other_repo.mkdir()
+        projects = [temp_repo, other_repo]
+
+        _sync_projects(
+            {p: ArtifactInjector(p) for p in projects},
+            *_load_registry_cached(temp_registry, ("global",)),
+        )
+
+        for project in projects:
+            assert (project / "AGENTS.md").exists()
+            assert (project / ".claude" / "commands" / "ego-validate.md").exists()
+            assert (project / ".augment" / "commands" / "ego-validate.md").exists()
+
+    def test_sync_projects_preserves_human_agents_md_content(
+        self,
+        temp_registry: Path,
+        temp_repo: Path,
+    ) -> None:
+        """Test that watch sync only replaces the EgoKit section of AGENTS.md."""
+        agents_md = temp_repo / "AGENTS.md"
+        agents_md.write_text(
+            "# My Project\n\nHand-written notes.\n\n"
+            f"{EGOKIT_BEGIN_MARKER}\nstale\n{EGOKIT_END_MARKER}\n\n## Footer\n",
+        )
+
+        _sync_projects(
+            {temp_repo: ArtifactInjector(temp_repo)},
+            *_load_registry_cached(temp_registry, ("global",)),
+        )
+
+        content = agents_md.read_text()
+        assert content.startswith("# My Project\n\nHand-written notes.")
+        assert content.rstrip().endswith("## Footer")
+        assert "stale" not in content
+        assert content.count(EGOKIT_BEGIN_MARKER) == 1
+
     def test_apply_command_with_scope_precedence(
         self,
         runner: CliRunner,
@@ -276,6 +575,21 @@ class TestCLI:
         # Should still work with global scope even if team scope doesn't exist
         assert result.exit_code == 0 or "not found" in result.stdout.lower()
 
+    def test_apply_defaults_to_current_directory(
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_registry: Path,
+        temp_repo: Path,
+    ) -> None:
+        """Test that apply without --repo targets the directory it runs in."""
+        monkeypatch.chdir(temp_repo)
+
+        result = runner.invoke(app, ["apply", "--registry", str(temp_registry)])
+
+        assert result.exit_code == 0
+        assert (temp_repo / "AGENTS.md").exists()
+
     def test_cli_error_handling(self, runner: CliRunner) -> None:
         """Test CLI error handling for missing registry."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -299,6 +613,34 @@ class TestCLI:
         version_pattern = r"\d+\.\d+\.\d+"
         assert re.search(version_pattern, result.stdout) or "unknown" in result.stdout
 
+    def test_entry_point_version_fast_path(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test the script entry point answers --version without Typer."""
+        from egokit.__main__ import main
+
+        monkeypatch.setattr("sys.argv", ["ego", "--version"])
+        main()
+
+        assert capsys.readouterr().out.startswith("EgoKit version ")
+
+    def test_entry_point_version_does_not_import_typer(self) -> None:
+        """Test that the --version fast path never imports Typer or the CLI module."""
+        code = (
+            "import sys; from egokit.__main__ import main; "
+            "sys.argv = ['ego', '--version']; main(); "
+            "print(sorted(m for m in ('typer', 'egokit.cli') if m in sys.modules))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+
+        version_line, imported = result.stdout.splitlines()
+        assert version_line.startswith("EgoKit version ")
+        assert imported == "[]"
+
     def test_apply_force_flag_skips_confirmation(
         self,
         runner: CliRunner,
@@ -7,9 +7,11 @@ from pathlib import Path
 import pytest
 
 from egokit.compiler import (
+    _STYLE_TAGS,
     EGOKIT_BEGIN_MARKER,
     EGOKIT_END_MARKER,
     ArtifactCompiler,
+    ArtifactInjector,
     extract_human_content,
     find_egokit_section,
 )
@@ -313,6 +315,26 @@ This is my project description.
         assert len(security_rules) == 1
         assert security_rules[0].id == "SEC-001"
 
+    def test_rules_extracted_once_per_compiler(self, sample_context: CompilationContext) -> None:
+        """Test that the extracted rules are reused across artifact generation."""
+        compiler = ArtifactCompiler(sample_context)
+
+        assert compiler._rules is compiler._rules
+        assert compiler._rules == compiler._extract_rules_from_charter()
+
+    def test_rule_buckets_partition_by_severity_and_tag(
+        self, sample_context: CompilationContext,
+    ) -> None:
+        """Test that rule buckets match the per-section rule filters."""
+        compiler = ArtifactCompiler(sample_context)
+        rules = compiler._rules
+        buckets = compiler._rule_buckets
+
+        for severity in Severity:
+            assert buckets[severity.value] == [r for r in rules if r.severity == severity]
+        assert buckets["security"] == [r for r in rules if "security" in (r.tags or [])]
+        assert buckets["style"] == [r for r in rules if not _STYLE_TAGS.isdisjoint(r.tags or [])]
+
 
 class TestArtifactInjector:
     """Test ArtifactInjector functionality."""
@@ -379,6 +401,23 @@ class TestArtifactInjector:
 
         assert agents_md.read_text() == "New content"
 
+    def test_inject_artifacts_skips_unchanged_files(self, temp_repo: Path) -> None:
+        """Test that files already holding the generated content are not rewritten."""
+        injector = ArtifactInjector(temp_repo)
+        artifacts = {
+            "AGENTS.md": "# Policies",
+            ".claude/commands/ego-validate.md": "# Validate command",
+        }
+
+        assert injector.inject_artifacts(artifacts) == 2
+        command = temp_repo / ".claude" / "commands" / "ego-validate.md"
+        mtime = command.stat().st_mtime_ns
+
+        artifacts["AGENTS.md"] = "# Updated policies"
+        assert injector.inject_artifacts(artifacts) == 1
+        assert (temp_repo / "AGENTS.md").read_text() == "# Updated policies"
+        assert command.stat().st_mtime_ns == mtime
+
 
 class TestMarkerParsing:
     """Test helper functions for EgoKit marker parsing."""
@@ -92,6 +92,17 @@ class TestClaudeCodeParser:
         assert len(files) == 2
         assert all(f.suffix == ".jsonl" for f in files)
 
+    def test_discover_finds_nested_jsonl_files(self, tmp_path: Path) -> None:
+        """Test that discover recurses into nested project directories."""
+        nested_dir = tmp_path / "projects" / "a" / "b"
+        nested_dir.mkdir(parents=True)
+        (nested_dir / "deep.jsonl").write_text("{}\n")
+        (tmp_path / "projects" / "top.jsonl").write_text("{}\n")
+
+        parser = ClaudeCodeParser()
+        files = parser.discover(tmp_path / "projects")
+        assert sorted(f.name for f in files) == ["deep.jsonl", "top.jsonl"]
+
     def test_parse_user_message(self, tmp_path: Path) -> None:
         """Test parsing a user message from JSONL."""
         log_file = tmp_path / "test.jsonl"
@@ -106,6 +117,17 @@ class TestClaudeCodeParser:
         assert sessions[0].messages[0].role == MessageRole.USER
         assert sessions[0].messages[0].content == "Hello Claude"
 
+    def test_parse_skips_malformed_lines(self, tmp_path: Path) -> None:
+        """Test that invalid JSON and invalid UTF-8 lines are skipped."""
+        log_file = tmp_path / "test.jsonl"
+        valid = json.dumps({"type": "human", "message": {"content": "Hello"}})
+        log_file.write_bytes(b"{not json\n\xff\xfe\n" + valid.encode() + b"\n")
+
+        parser = ClaudeCodeParser()
+        sessions = list(parser.parse(log_file))
+        assert len(sessions) == 1
+        assert [m.content for m in sessions[0].messages] == ["Hello"]
+
     def test_parse_assistant_message(self, tmp_path: Path) -> None:
         """Test parsing an assistant message from JSONL."""
         log_file = tmp_path / "test.jsonl"
@@ -266,6 +288,41 @@ class TestPatternDetector:
         assert len(corrections) == 1
         assert corrections[0].category == "type_hints"
 
+    def test_correction_sessions_keep_first_seen_order(self) -> None:
+        """Test that pattern sessions are deduplicated in first-seen order."""
+        sessions = [
+            Session(
+                session_id=session_id,
+                messages=[Message(role=MessageRole.USER, content="No, add type hints")],
+                source="test",
+            )
+            for session_id in ["s3", "s1", "s3", "s2"]
+        ]
+        detector = PatternDetector()
+        corrections = detector.detect_corrections(sessions)
+        assert corrections[0].sessions == ["s3", "s1", "s2"]
+
+    def test_detect_all_matches_individual_detectors(self) -> None:
+        """Test that detect_all agrees with running each detector separately."""
+        session = self._make_session([
+            "No, add type hints please",
+            "Actually, the type annotation is wrong",
+            "Be concise",
+            "Too verbose, keep it short",
+            "<supervisor>No, system context</supervisor>",
+            "Remember SEC-001",
+            "SEC-001 again",
+        ])
+        detector = PatternDetector()
+
+        corrections, style_prefs, implicit = detector.detect_all([session])
+
+        assert corrections == detector.detect_corrections([session])
+        assert style_prefs == detector.detect_style_preferences([session])
+        assert implicit == detector.detect_implicit_patterns([session])
+        assert [p.preference for p in style_prefs] == ["concise"]
+        assert [p.occurrences for p in implicit] == [2]
+
     def test_filters_system_noise(self) -> None:
         """Test that system-injected content is filtered out."""
         session = self._make_session([
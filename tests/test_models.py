@@ -1,5 +1,8 @@
 """Tests for EgoKit data models."""
 
+import subprocess
+import sys
+
 import pytest
 from pydantic import ValidationError
 
@@ -205,3 +208,36 @@ class TestPolicyCharterWithSession:
         )
         assert charter.session is not None
         assert charter.session.startup.read == ["PROGRESS.md"]
+
+
+class TestPackageExports:
+    """Test lazily resolved package-level exports."""
+
+    def test_lazy_exports_resolve_to_submodule_objects(self) -> None:
+        """Test that public names resolve to the objects in their submodules."""
+        import egokit
+        from egokit.compiler import ArtifactCompiler
+        from egokit.registry import PolicyRegistry
+
+        assert egokit.ArtifactCompiler is ArtifactCompiler
+        assert egokit.PolicyRegistry is PolicyRegistry
+        assert egokit.Severity is Severity
+        assert set(egokit.__all__) <= set(dir(egokit))
+
+    def test_import_defers_submodules(self) -> None:
+        """Test that importing the package does not import compiler or pydantic."""
+        code = (
+            "import sys, egokit; "
+            "print(sorted(m for m in ('egokit.compiler', 'pydantic') if m in sys.modules))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        import egokit
+
+        with pytest.raises(AttributeError):
+            _ = egokit.DoesNotExist
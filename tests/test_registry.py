@@ -1,7 +1,9 @@
 """Tests for PolicyRegistry core functionality."""
 
+import os
 import tempfile
 from pathlib import Path
+from typing import BinaryIO
 
 import pytest
 import yaml
@@ -202,6 +204,15 @@ class TestPolicyRegistry:
         assert ego_config.tone.voice == "technical, direct"
         assert ego_config.tone.verbosity == "detailed"
 
+    def test_load_ego_config_parse_error_names_file(self, temp_registry: Path) -> None:
+        """Test that YAML parse errors identify the broken scope file."""
+        ego_path = temp_registry / "ego" / "teams" / "backend.yaml"
+        ego_path.write_text("ego: [unclosed\n")
+        registry = PolicyRegistry(temp_registry)
+
+        with pytest.raises(RegistryError, match=r"backend\.yaml"):
+            registry.load_ego_config("teams/backend")
+
     def test_load_ego_config_missing_file(self, temp_registry: Path) -> None:
         """Test ego config loading with missing file."""
         registry = PolicyRegistry(temp_registry)
@@ -290,3 +301,49 @@ class TestPolicyRegistry:
         # Try to merge with only nonexistent scopes
         with pytest.raises(ScopeError, match="No valid ego configurations found"):
             registry.merge_ego_configs(["nonexistent", "also/missing"])
+
+    def test_reload_reparses_only_changed_files(
+        self,
+        temp_registry: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a reused registry re-parses only files edited since the last load."""
+        registry = PolicyRegistry(temp_registry)
+        registry.load_charter(validate=False)
+        registry.load_ego_config("global", validate=False)
+
+        parsed: list[str] = []
+        real_load = yaml.load
+
+        def counting_load(stream: BinaryIO, Loader: type) -> object:  # noqa: N803
+            parsed.append(stream.name)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        ego_path = temp_registry / "ego" / "global.yaml"
+        ego_path.write_text(
+            ego_path.read_text().replace("Senior Software Engineer", "Staff Engineer"),
+        )
+
+        charter = registry.load_charter(validate=False)
+        ego_config = registry.load_ego_config("global", validate=False)
+
+        assert charter.version == "1.0.0"
+        assert ego_config.role == "Staff Engineer"
+        assert len(parsed) == 1
+
+    def test_reload_detects_edit_that_keeps_size_and_mtime(
+        self,
+        temp_registry: Path,
+    ) -> None:
+        """Test that a reused registry re-parses same-size edits with a restored mtime."""
+        registry = PolicyRegistry(temp_registry)
+        assert registry.load_charter(validate=False).version == "1.0.0"
+
+        charter_path = temp_registry / "charter.yaml"
+        stat = charter_path.stat()
+        charter_path.write_text(charter_path.read_text().replace("1.0.0", "1.0.9"))
+        os.utime(charter_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert registry.load_charter(validate=False).version == "1.0.9"